@@ -74,6 +74,18 @@ class ODSConnectionManager:
         except Exception:
             pass
 
+    @classmethod
+    def _reset_for_tests(cls) -> None:
+        """Drop the singleton and all cached connection state without contacting the server.
+
+        Intended for test isolation only; use disconnect() to close a live connection.
+        """
+        cls._instance = None
+        cls._con_i = None
+        cls._model_cache = None
+        cls._model = None
+        cls._connection_info = None
+
     @classmethod
     def get_instance(cls) -> ODSConnectionManager:
         """Get singleton instance."""
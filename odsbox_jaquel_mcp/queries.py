@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 from fastmcp.exceptions import ToolError
@@ -11,27 +13,34 @@ from odsbox.proto import ods
 from .connection import ODSConnectionManager
 
 
+def _read_only_patterns(patterns: dict[str, dict[str, str]]) -> Mapping[str, Mapping[str, str]]:
+    """Wrap a pattern table and each of its entries in read-only mapping proxies."""
+    return MappingProxyType({name: MappingProxyType(pattern) for name, pattern in patterns.items()})
+
+
 class JaquelExamples:
     """Provides Jaquel query examples and templates."""
 
-    BASIC_PATTERNS = {
-        "get_all_instances": {
-            "template": """{
+    # Read-only canonical templates, including each pattern entry; get_pattern hands out copies
+    BASIC_PATTERNS: Mapping[str, Mapping[str, str]] = _read_only_patterns(
+        {
+            "get_all_instances": {
+                "template": """{
     "EntityName": {},
     "$options": {
         "$rowlimit": 5
     }
 }""",
-            "description": "Get all instances (limited to 5)",
-            "explanation": ("Empty {} means no filter. $rowlimit prevents large result sets."),
-        },
-        "get_by_id": {
-            "template": '{"EntityName": 123}',
-            "description": "Get instance by ID (shorthand)",
-            "explanation": 'Full: {"EntityName": {"id": 123}}',
-        },
-        "get_by_name": {
-            "template": """{
+                "description": "Get all instances (limited to 5)",
+                "explanation": ("Empty {} means no filter. $rowlimit prevents large result sets."),
+            },
+            "get_by_id": {
+                "template": '{"EntityName": 123}',
+                "description": "Get instance by ID (shorthand)",
+                "explanation": 'Full: {"EntityName": {"id": 123}}',
+            },
+            "get_by_name": {
+                "template": """{
     "EntityName": {
         "name": "SearchName"
     },
@@ -40,11 +49,11 @@ class JaquelExamples:
         "name": 1
     }
 }""",
-            "description": "Get instances by name",
-            "explanation": "1 means include attribute",
-        },
-        "case_insensitive_search": {
-            "template": """{
+                "description": "Get instances by name",
+                "explanation": "1 means include attribute",
+            },
+            "case_insensitive_search": {
+                "template": """{
     "EntityName": {
         "name": {
             "$like": "Search*",
@@ -52,11 +61,11 @@ class JaquelExamples:
         }
     }
 }""",
-            "description": "Case-insensitive wildcard search",
-            "explanation": ("$like uses * and ? wildcards. $options: 'i' = case-insensitive"),
-        },
-        "time_range": {
-            "template": """{
+                "description": "Case-insensitive wildcard search",
+                "explanation": ("$like uses * and ? wildcards. $options: 'i' = case-insensitive"),
+            },
+            "time_range": {
+                "template": """{
     "AoMeasurement": {
         "measurement_begin": {
             "$between": [
@@ -66,11 +75,11 @@ class JaquelExamples:
         }
     }
 }""",
-            "description": "Query time range",
-            "explanation": "Use ISO 8601 or ODS time format",
-        },
-        "inner_join": {
-            "template": """{
+                "description": "Query time range",
+                "explanation": "Use ISO 8601 or ODS time format",
+            },
+            "inner_join": {
+                "template": """{
     "AoMeasurementQuantity": {},
     "$attributes": {
         "name": 1,
@@ -78,11 +87,11 @@ class JaquelExamples:
         "quantity.name": 1
     }
 }""",
-            "description": "Inner join with related entities",
-            "explanation": ("Use dot notation. Related record must exist."),
-        },
-        "outer_join": {
-            "template": """{
+                "description": "Inner join with related entities",
+                "explanation": ("Use dot notation. Related record must exist."),
+            },
+            "outer_join": {
+                "template": """{
     "AoMeasurementQuantity": {},
     "$attributes": {
         "name": 1,
@@ -90,11 +99,11 @@ class JaquelExamples:
         "quantity:OUTER.name": 1
     }
 }""",
-            "description": "Outer join",
-            "explanation": ("Use :OUTER suffix. Handles sparse data."),
-        },
-        "aggregates": {
-            "template": """{
+                "description": "Outer join",
+                "explanation": ("Use :OUTER suffix. Handles sparse data."),
+            },
+            "aggregates": {
+                "template": """{
     "AoUnit": {},
     "$attributes": {
         "factor": {
@@ -108,8 +117,26 @@ class JaquelExamples:
         }
     }
 }""",
-            "description": "Aggregate functions",
-            "explanation": ("$min/$max/$avg for numeric. $distinct for unique values."),
+                "description": "Aggregate functions",
+                "explanation": ("$min/$max/$avg for numeric. $distinct for unique values."),
+            },
+        }
+    )
+
+    # Query skeleton builders keyed by operation, see query_generate_skeleton
+    _SKELETON_BUILDERS: dict[str, Callable[[str], dict[str, Any]]] = {
+        "get_all": lambda entity_name: {
+            entity_name: {},
+            "$attributes": {"id": 1, "name": 1},
+            "$options": {"$rowlimit": 5},
+        },
+        "get_by_id": lambda entity_name: {entity_name: 123, "$attributes": {"*": 1}},
+        "get_by_name": lambda entity_name: {entity_name: {"name": "SearchName"}, "$attributes": {"*": 1}},
+        "search_and_select": lambda entity_name: {
+            entity_name: {"name": {"$like": "Search*"}},
+            "$attributes": {"id": 1, "name": 1},
+            "$orderby": {"name": 1},
+            "$options": {"$rowlimit": 10},
         },
     }
 
@@ -118,7 +145,7 @@ class JaquelExamples:
         """Get a specific query pattern."""
         if pattern_name not in JaquelExamples.BASIC_PATTERNS:
             raise ValueError(f"Unknown pattern: {pattern_name}")
-        return JaquelExamples.BASIC_PATTERNS[pattern_name]
+        return dict(JaquelExamples.BASIC_PATTERNS[pattern_name])
 
     @staticmethod
     def list_patterns() -> list[str]:
@@ -133,21 +160,11 @@ class JaquelExamples:
             entity_name: Name of the entity
             operation: Type of query
         """
-        skeletons: dict[str, dict[str, Any]] = {
-            "get_all": {entity_name: {}, "$attributes": {"id": 1, "name": 1}, "$options": {"$rowlimit": 5}},
-            "get_by_id": {entity_name: 123, "$attributes": {"*": 1}},
-            "get_by_name": {entity_name: {"name": "SearchName"}, "$attributes": {"*": 1}},
-            "search_and_select": {
-                entity_name: {"name": {"$like": "Search*"}},
-                "$attributes": {"id": 1, "name": 1},
-                "$orderby": {"name": 1},
-                "$options": {"$rowlimit": 10},
-            },
-        }
-
-        if operation not in skeletons:
+        builder = JaquelExamples._SKELETON_BUILDERS.get(operation)
+        if builder is None:
             raise ValueError(f"Unknown operation: {operation}")
-        return skeletons[operation]
+        # Build only the requested skeleton; each call gets a fresh, mutable dict
+        return builder(entity_name)
 
 
 class JaquelExplain:
@@ -92,6 +92,9 @@ class EntityDescriptions:
         ),
     }
 
+    # Lower-cased keys for O(1) case-insensitive lookups
+    _DESCRIPTIONS_LOWER = {key.lower(): value for key, value in DESCRIPTIONS.items()}
+
     @staticmethod
     def get_entity_description(entity: ods.Model.Entity) -> str | None:
         """Get description for an entity.
@@ -119,15 +122,10 @@ class EntityDescriptions:
         Returns:
             Description string or None if not found
         """
-        # Try direct lookup first
-        if entity_base_name in EntityDescriptions.DESCRIPTIONS:
-            return EntityDescriptions.DESCRIPTIONS[entity_base_name]
-
-        # Fall back to case-insensitive lookup
-        for key, value in EntityDescriptions.DESCRIPTIONS.items():
-            if key.lower() == entity_base_name.lower():
-                return value
-        return None
+        description = EntityDescriptions.DESCRIPTIONS.get(entity_base_name)
+        if description is None:
+            description = EntityDescriptions._DESCRIPTIONS_LOWER.get(entity_base_name.lower())
+        return description
 
     @staticmethod
     def has_description(entity_base_name: str) -> bool:
@@ -139,15 +137,10 @@ class EntityDescriptions:
         Returns:
             True if description exists, False otherwise
         """
-        # Try direct lookup first
-        if entity_base_name in EntityDescriptions.DESCRIPTIONS:
-            return True
-
-        # Fall back to case-insensitive lookup
-        for key in EntityDescriptions.DESCRIPTIONS.keys():
-            if key.lower() == entity_base_name.lower():
-                return True
-        return False
+        return (
+            entity_base_name in EntityDescriptions.DESCRIPTIONS
+            or entity_base_name.lower() in EntityDescriptions._DESCRIPTIONS_LOWER
+        )
 
     @staticmethod
     def list_base_entities() -> list[str]:
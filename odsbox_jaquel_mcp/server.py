@@ -441,6 +441,8 @@ async def data_read_submatrix(
     """Read timeseries data from a submatrix using bulk data access."""
     if submatrix_id <= 0:
         raise ValueError("submatrix_id must be a positive integer (> 0)")
+    if max_preview_size <= 0:
+        raise ValueError("max_preview_size must be a positive integer (> 0)")
     if ctx:
         await ctx.info(f"Reading submatrix {submatrix_id}...")
     result = SubmatrixDataReader.data_read_submatrix(
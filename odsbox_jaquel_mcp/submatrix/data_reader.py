@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Literal, cast
 
+import numpy as np
 import pandas as pd
 from fastmcp.exceptions import ToolError
 
@@ -23,8 +24,8 @@ def _resample_dataframe_uniform(df: pd.DataFrame, target_size: int) -> pd.DataFr
     if len(df) <= target_size:
         return df
 
-    # Calculate indices for uniform sampling
-    indices = [int(i * len(df) / target_size) for i in range(target_size)]
+    # Calculate indices for uniform sampling with integer arithmetic in one vectorized step
+    indices = np.arange(target_size) * len(df) // target_size
     return df.iloc[indices].copy()
 
 
@@ -118,12 +119,11 @@ def _resample_dataframe_stratified(df: pd.DataFrame, target_size: int) -> pd.Dat
 
     if numeric_col is not None:
         # Stratify based on numeric column
-        df_temp = df.copy()
-        df_temp["_bin"] = pd.qcut(df_temp[numeric_col], q=n_bins, labels=False, duplicates="drop")
+        # Rows are grouped by bin in one pass without copying the frame; NaN bins are dropped
+        bins = pd.qcut(df[numeric_col], q=n_bins, labels=False, duplicates="drop")
         sampled_indices = []
 
-        for bin_val in df_temp["_bin"].unique():
-            bin_df = df_temp[df_temp["_bin"] == bin_val]
+        for _, bin_df in df.groupby(bins, sort=False):
             n_samples = min(samples_per_bin, len(bin_df))
             sampled_indices.extend(bin_df.sample(n=n_samples, random_state=42).index.tolist())
 
@@ -155,29 +155,32 @@ def _resample_dataframe_minmax(df: pd.DataFrame, target_size: int) -> pd.DataFra
     sampled_indices.add(0)
     sampled_indices.add(len(df) - 1)
 
-    # For each numeric column, include min and max indices
-    for col in df.columns:
-        if pd.api.types.is_numeric_dtype(df[col]) and len(sampled_indices) < target_size:
-            # Skip columns with all NaN
-            if not df[col].isna().all():
-                sampled_indices.add(int(df[col].idxmin()))
-                sampled_indices.add(int(df[col].idxmax()))
+    # For each numeric column, include min and max positions
+    # Both are reduced over the whole numeric block at once; all-NaN columns are skipped
+    numeric = df.loc[:, [pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes]].dropna(axis=1, how="all")
+    numeric = numeric.reset_index(drop=True)
+    for min_pos, max_pos in zip(numeric.idxmin(), numeric.idxmax()):
+        if len(sampled_indices) >= target_size:
+            break
+        sampled_indices.add(int(min_pos))
+        sampled_indices.add(int(max_pos))
 
     # Fill remaining with uniform sampling
     if len(sampled_indices) < target_size:
         remaining_size = target_size - len(sampled_indices)
-        all_indices = set(range(len(df)))
-        available_indices = list(all_indices - sampled_indices)
+        # Unused positions come from a boolean mask scan instead of building set(range(len(df)))
+        available = np.ones(len(df), dtype=bool)
+        available[list(sampled_indices)] = False
+        available_indices = np.flatnonzero(available)
 
-        if available_indices:
+        if len(available_indices):
             step = len(available_indices) // remaining_size
             if step > 0:
                 uniform_indices = available_indices[::step][:remaining_size]
-                sampled_indices.update(uniform_indices)
+                sampled_indices.update(uniform_indices.tolist())
 
-    # Convert index positions to actual DataFrame indices
-    result_indices = [df.index[i] if isinstance(i, int) and i < len(df) else i for i in sorted(sampled_indices)]
-    return df.loc[result_indices]
+    # All collected indices are row positions
+    return df.iloc[sorted(sampled_indices)]
 
 
 def _resample_dataframe(
@@ -210,13 +213,12 @@ def _resample_dataframe(
             method = "time_aware"
         else:
             # Check if data has high variance (preserve extremes)
-            has_high_variance = False
-            for col in df.columns:
-                if pd.api.types.is_numeric_dtype(df[col]) and not df[col].isna().all():
-                    cv = df[col].std() / df[col].mean() if df[col].mean() != 0 else 0
-                    if abs(cv) > 0.5:  # Coefficient of variation > 0.5
-                        has_high_variance = True
-                        break
+            # Mean and std of all numeric columns are reduced in one pass each;
+            # all-NaN columns yield a NaN coefficient and never count as high variance
+            numeric = df.loc[:, [pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes]]
+            means = numeric.mean()
+            cv = (numeric.std() / means).where(means != 0, 0.0)
+            has_high_variance = bool((cv.abs() > 0.5).any())  # Coefficient of variation > 0.5
 
             method = "minmax" if has_high_variance else "uniform"
 
@@ -4,55 +4,156 @@ from __future__ import annotations
 
 from typing import Any
 
+# Comparison operators with a fixed value shape, checked in JaquelValidator._validate_operator_dict
+_UNARY_OPERATORS = frozenset({"$null", "$notnull"})
+_LIST_OPERATORS = frozenset({"$between", "$in", "$notinset"})
+
+# Operator documentation served by JaquelValidator.get_operator_info
+_OPERATOR_DOCS: dict[str, dict[str, str]] = {
+    "$eq": {
+        "category": "comparison",
+        "description": "Equal comparison",
+        "example": '{"name": {"$eq": "MyTest"}}',
+        "options": "Use $options: 'i' for case-insensitive",
+    },
+    "$neq": {
+        "category": "comparison",
+        "description": "Not equal comparison",
+        "example": '{"status": {"$neq": "active"}}',
+    },
+    "$lt": {
+        "category": "comparison",
+        "description": "Less than",
+        "example": '{"value": {"$lt": 100}}',
+    },
+    "$gt": {
+        "category": "comparison",
+        "description": "Greater than",
+        "example": '{"value": {"$gt": 0}}',
+    },
+    "$lte": {
+        "category": "comparison",
+        "description": "Less than or equal",
+        "example": '{"value": {"$lte": 100}}',
+    },
+    "$gte": {
+        "category": "comparison",
+        "description": "Greater than or equal",
+        "example": '{"value": {"$gte": 0}}',
+    },
+    "$in": {
+        "category": "comparison",
+        "description": "Value in array",
+        "example": '{"id": {"$in": [1, 2, 3]}}',
+    },
+    "$like": {
+        "category": "comparison",
+        "description": "Wildcard match (* and ?)",
+        "example": '{"name": {"$like": "Test*"}}',
+        "options": "Use $options: 'i' for case-insensitive",
+    },
+    "$between": {
+        "category": "comparison",
+        "description": "Value between two values",
+        "example": '{"date": {"$between": ["2023-01-01", "2023-12-31"]}}',
+    },
+    "$null": {
+        "category": "comparison",
+        "description": "Is null value",
+        "example": '{"field": {"$null": 1}}',
+    },
+    "$notnull": {
+        "category": "comparison",
+        "description": "Is not null value",
+        "example": '{"field": {"$notnull": 1}}',
+    },
+    "$and": {
+        "category": "logical",
+        "description": "Logical AND - all must be true",
+        "example": '{"$and": [{"status": "active"}, {"value": {"$gt": 0}}]}',
+    },
+    "$or": {
+        "category": "logical",
+        "description": "Logical OR - at least one true",
+        "example": '{"$or": [{"status": "active"}, {"status": "pending"}]}',
+    },
+    "$not": {
+        "category": "logical",
+        "description": "Logical NOT",
+        "example": '{"$not": {"status": "inactive"}}',
+    },
+    "$distinct": {
+        "category": "aggregate",
+        "description": "Get distinct values",
+        "example": '{"$attributes": {"name": {"$distinct": 1}}}',
+    },
+    "$min": {
+        "category": "aggregate",
+        "description": "Get minimum value",
+        "example": '{"$attributes": {"value": {"$min": 1}}}',
+    },
+    "$max": {
+        "category": "aggregate",
+        "description": "Get maximum value",
+        "example": '{"$attributes": {"value": {"$max": 1}}}',
+    },
+}
+
 
 class JaquelValidator:
     """Validates and analyzes Jaquel query structures."""
 
     # Valid operators in Jaquel
-    COMPARISON_OPERATORS = {
-        "$eq",
-        "$neq",
-        "$lt",
-        "$gt",
-        "$lte",
-        "$gte",
-        "$in",
-        "$notinset",
-        "$like",
-        "$notlike",
-        "$null",
-        "$notnull",
-        "$between",
-    }
+    COMPARISON_OPERATORS = frozenset(
+        {
+            "$eq",
+            "$neq",
+            "$lt",
+            "$gt",
+            "$lte",
+            "$gte",
+            "$in",
+            "$notinset",
+            "$like",
+            "$notlike",
+            "$null",
+            "$notnull",
+            "$between",
+        }
+    )
 
-    LOGICAL_OPERATORS = {"$and", "$or", "$not"}
+    LOGICAL_OPERATORS = frozenset({"$and", "$or", "$not"})
 
-    AGGREGATE_FUNCTIONS = {
-        "$none",
-        "$count",
-        "$dcount",
-        "$min",
-        "$max",
-        "$avg",
-        "$stddev",
-        "$sum",
-        "$distinct",
-        "$point",
-        "$ia",
-    }
+    AGGREGATE_FUNCTIONS = frozenset(
+        {
+            "$none",
+            "$count",
+            "$dcount",
+            "$min",
+            "$max",
+            "$avg",
+            "$stddev",
+            "$sum",
+            "$distinct",
+            "$point",
+            "$ia",
+        }
+    )
 
-    SPECIAL_KEYS = {
-        "$attributes",
-        "$orderby",
-        "$groupby",
-        "$options",
-        "$unit",
-        "$nested",
-        "$rowlimit",
-        "$rowskip",
-        "$seqlimit",
-        "$seqskip",
-    }
+    SPECIAL_KEYS = frozenset(
+        {
+            "$attributes",
+            "$orderby",
+            "$groupby",
+            "$options",
+            "$unit",
+            "$nested",
+            "$rowlimit",
+            "$rowskip",
+            "$seqlimit",
+            "$seqskip",
+        }
+    )
 
     ALL_OPERATORS = COMPARISON_OPERATORS | LOGICAL_OPERATORS | AGGREGATE_FUNCTIONS | SPECIAL_KEYS
 
@@ -79,11 +180,11 @@ class JaquelValidator:
                                 if isinstance(item, dict):
                                     JaquelValidator._validate_operator_dict(item, f"{path}.{key}[{i}]", errors, issues)
                 elif key in JaquelValidator.COMPARISON_OPERATORS:
-                    if key in ["$null", "$notnull"]:
+                    if key in _UNARY_OPERATORS:
                         if value != 1:
                             msg = f"{key} should have value 1 at '{path}'"
                             issues.append(msg)
-                    elif key in ["$between", "$in", "$notinset"]:
+                    elif key in _LIST_OPERATORS:
                         if not isinstance(value, list):
                             msg = f"{key} requires a list value at '{path}'"
                             errors.append(msg)
@@ -182,97 +283,9 @@ class JaquelValidator:
     @staticmethod
     def get_operator_info(operator: str) -> dict[str, Any]:
         """Get information about a Jaquel operator."""
-        operator_docs = {
-            "$eq": {
-                "category": "comparison",
-                "description": "Equal comparison",
-                "example": '{"name": {"$eq": "MyTest"}}',
-                "options": "Use $options: 'i' for case-insensitive",
-            },
-            "$neq": {
-                "category": "comparison",
-                "description": "Not equal comparison",
-                "example": '{"status": {"$neq": "active"}}',
-            },
-            "$lt": {
-                "category": "comparison",
-                "description": "Less than",
-                "example": '{"value": {"$lt": 100}}',
-            },
-            "$gt": {
-                "category": "comparison",
-                "description": "Greater than",
-                "example": '{"value": {"$gt": 0}}',
-            },
-            "$lte": {
-                "category": "comparison",
-                "description": "Less than or equal",
-                "example": '{"value": {"$lte": 100}}',
-            },
-            "$gte": {
-                "category": "comparison",
-                "description": "Greater than or equal",
-                "example": '{"value": {"$gte": 0}}',
-            },
-            "$in": {
-                "category": "comparison",
-                "description": "Value in array",
-                "example": '{"id": {"$in": [1, 2, 3]}}',
-            },
-            "$like": {
-                "category": "comparison",
-                "description": "Wildcard match (* and ?)",
-                "example": '{"name": {"$like": "Test*"}}',
-                "options": "Use $options: 'i' for case-insensitive",
-            },
-            "$between": {
-                "category": "comparison",
-                "description": "Value between two values",
-                "example": '{"date": {"$between": ["2023-01-01", "2023-12-31"]}}',
-            },
-            "$null": {
-                "category": "comparison",
-                "description": "Is null value",
-                "example": '{"field": {"$null": 1}}',
-            },
-            "$notnull": {
-                "category": "comparison",
-                "description": "Is not null value",
-                "example": '{"field": {"$notnull": 1}}',
-            },
-            "$and": {
-                "category": "logical",
-                "description": "Logical AND - all must be true",
-                "example": '{"$and": [{"status": "active"}, {"value": {"$gt": 0}}]}',
-            },
-            "$or": {
-                "category": "logical",
-                "description": "Logical OR - at least one true",
-                "example": '{"$or": [{"status": "active"}, {"status": "pending"}]}',
-            },
-            "$not": {
-                "category": "logical",
-                "description": "Logical NOT",
-                "example": '{"$not": {"status": "inactive"}}',
-            },
-            "$distinct": {
-                "category": "aggregate",
-                "description": "Get distinct values",
-                "example": '{"$attributes": {"name": {"$distinct": 1}}}',
-            },
-            "$min": {
-                "category": "aggregate",
-                "description": "Get minimum value",
-                "example": '{"$attributes": {"value": {"$min": 1}}}',
-            },
-            "$max": {
-                "category": "aggregate",
-                "description": "Get maximum value",
-                "example": '{"$attributes": {"value": {"$max": 1}}}',
-            },
-        }
-
-        if operator not in operator_docs:
+        docs = _OPERATOR_DOCS.get(operator)
+        if docs is None:
             raise ValueError(f"Unknown operator: {operator}")
 
-        return operator_docs[operator]
+        # Copy so callers cannot modify the shared documentation table
+        return dict(docs)
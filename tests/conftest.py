@@ -1,9 +1,30 @@
 """Pytest configuration and fixtures for tests."""
 
+import socket
+from urllib.parse import urlsplit
+
 import pytest
+import pytest_asyncio
 
 from tests.mcp_test_client import MCPServerTestClient
 
+INTEGRATION_CREDENTIALS = {
+    "url": "https://docker.peak-solution.de:10032/api",
+    "username": "Demo",
+    "password": "mdm",
+}
+
+
+def _ods_server_reachable(url: str, timeout: float = 3.0) -> bool:
+    """Check whether a TCP connection to the ODS server can be opened."""
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    try:
+        with socket.create_connection((parts.hostname, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
 
 def pytest_configure(config):
     """Register custom markers."""
@@ -11,12 +32,37 @@ def pytest_configure(config):
         "markers", "integration: marks tests as integration tests (deselect with '-m \"not integration\"')"
     )
     config.addinivalue_line("markers", "unit: marks tests as unit tests (select with '-m unit')")
+    config.addinivalue_line(
+        "markers", "serial: marks stateful tests that must run on a single xdist worker (use '--dist=loadgroup')"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Route stateful tests to one xdist worker group and skip live ODS tests when offline.
+
+    Tests depending on ``integration_credentials`` need the live ODS server. Its reachability is
+    probed once here, so an unreachable server skips them before any connect attempt runs into
+    network timeouts. Together with tests marked ``serial`` they share one worker under
+    ``--dist=loadgroup``, as the demo server does not tolerate parallel logins of the same account.
+    """
+    ods_items = [item for item in items if "integration_credentials" in getattr(item, "fixturenames", ())]
+    if ods_items and not _ods_server_reachable(INTEGRATION_CREDENTIALS["url"]):
+        skip_ods = pytest.mark.skip(reason=f"ODS server {INTEGRATION_CREDENTIALS['url']} is not reachable")
+        for item in ods_items:
+            item.add_marker(skip_ods)
+
+    stateful_group = pytest.mark.xdist_group("ods_stateful")
+    for item in items:
+        if item.get_closest_marker("serial") or "integration_credentials" in getattr(item, "fixturenames", ()):
+            item.add_marker(stateful_group)
 
 
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def mcp_client():
     """MCP server test client fixture.
 
+    The server subprocess is started once and shared by all tests of the session.
+
     Yields:
         MCPServerTestClient connected to server or skips if unable to connect
     """
@@ -30,15 +76,74 @@ async def mcp_client():
         pytest.skip(f"Could not start MCP server: {e}")
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_tools(mcp_client):
+    """Tool list of the shared MCP server, fetched once per session.
+
+    Returns:
+        list: Tool dicts as returned by MCPServerTestClient.list_tools()
+    """
+    return await mcp_client.list_tools()
+
+
+@pytest.fixture(scope="session")
+def mcp_tool_names(mcp_tools):
+    """Names of the shared MCP server's tools.
+
+    Returns:
+        frozenset: Tool names for membership and subset checks
+    """
+    return frozenset(tool["name"] for tool in mcp_tools)
+
+
+@pytest.fixture(scope="session")
 def integration_credentials():
     """Fixture providing ODS server credentials for integration tests.
 
+    Returns:
+        dict: Dictionary with url, username, and password
+    """
+    return dict(INTEGRATION_CREDENTIALS)
+
+
+@pytest.fixture(scope="session")
+def ods_auth(integration_credentials):
+    """Username/password tuple for ODSConnectionManager.connect, built once per session.
+
+    Returns:
+        tuple: (username, password)
+    """
+    return (integration_credentials["username"], integration_credentials["password"])
+
+
+@pytest.fixture(scope="session")
+def ods_connect_arguments(integration_credentials):
+    """Arguments for the ods_connect tool built from the integration credentials.
+
     Returns:
         dict: Dictionary with url, username, and password
     """
     return {
-        "url": "https://docker.peak-solution.de:10032/api",
-        "username": "Demo",
-        "password": "mdm",
+        "url": integration_credentials["url"],
+        "username": integration_credentials["username"],
+        "password": integration_credentials["password"],
     }
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def ods_session(mcp_client, ods_connect_arguments):
+    """Connect the shared MCP server to the ODS server once per session.
+
+    Fails early if the connect does not succeed, and checks that the connection
+    is still established before disconnecting at the end of the session.
+
+    Yields:
+        MCPServerTestClient with an established ODS connection
+    """
+    result = await mcp_client.call_tool("ods_connect", ods_connect_arguments)
+    assert not result["result"]["isError"], f"ods_connect failed: {result['result']['content']}"
+    yield mcp_client
+    info = await mcp_client.call_tool("ods_get_connection_info", {})
+    assert not info["result"]["isError"], f"ods_get_connection_info failed: {info['result']['content']}"
+    assert info["result"]["structuredContent"]["result"] is not None, "ODS connection was lost during the session"
+    await mcp_client.call_tool("ods_disconnect", {})
@@ -0,0 +1,35 @@
+"""Hypothesis strategies for generating Jaquel queries in tests."""
+
+from hypothesis import strategies as st
+
+PHYS_DIMENSION_EXPONENTS = (
+    "length_exp",
+    "mass_exp",
+    "time_exp",
+    "current_exp",
+    "temperature_exp",
+    "molar_amount_exp",
+    "luminous_intensity_exp",
+)
+
+_exponent = st.integers(min_value=-3, max_value=3)
+
+physical_dimensions = st.fixed_dictionaries({name: _exponent for name in PHYS_DIMENSION_EXPONENTS})
+
+
+@st.composite
+def unit_by_dimension_queries(draw, max_dimensions: int = 4):
+    """Build AoUnit queries filtering on one or more physical dimension exponent tuples.
+
+    Args:
+        draw: Hypothesis draw function
+        max_dimensions: Maximum number of '$or' branches
+
+    Returns:
+        Jaquel query dict
+    """
+    dimensions = draw(st.lists(physical_dimensions, min_size=1, max_size=max_dimensions))
+    return {
+        "AoUnit": {"phys_dimension": {"$or": dimensions}},
+        "$attributes": {"name": 1, "factor": 1, "offset": 1, "phys_dimension.name": 1},
+    }
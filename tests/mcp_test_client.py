@@ -33,6 +33,8 @@ class MCPServerTestClient:
         self.timeout = timeout
         self.session: ClientSession | None = None
         self._context_managers: list[AbstractAsyncContextManager[Any]] = []
+        self._tools_cache: list[dict[str, Any]] | None = None
+        self._resources_cache: list[dict[str, Any]] | None = None
 
     async def start(self) -> None:
         """Start MCP server and establish connection."""
@@ -61,6 +63,10 @@ class MCPServerTestClient:
                 raise RuntimeError("Failed to initialize MCP client session")
             await self.session.initialize()
 
+            # MCP allows no requests before the initialize response, so the manifests are
+            # fetched concurrently right after it and kept for list_tools()/list_resources()
+            await asyncio.gather(self.list_tools(), self.list_resources())
+
             print("✓ Connected to MCP server")
 
         except Exception as e:
@@ -78,6 +84,8 @@ class MCPServerTestClient:
                 print(f"Error closing connection: {e}")
         self._context_managers.clear()
         self.session = None
+        self._tools_cache = None
+        self._resources_cache = None
 
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """Call a tool on the MCP server.
@@ -87,7 +95,9 @@ class MCPServerTestClient:
             arguments: Tool arguments
 
         Returns:
-            Tool result as dict
+            Tool result as dict. ``result["structuredContent"]`` carries the tool's
+            dict output as already decoded by the MCP session, or None if the tool
+            produced no structured output (e.g. on errors).
         """
         if not self.session:
             raise RuntimeError("Not connected to MCP server. Call start() first.")
@@ -110,64 +120,95 @@ class MCPServerTestClient:
                         for c in result.content
                     ],
                     "isError": result.isError if hasattr(result, "isError") else False,
+                    "structuredContent": result.structuredContent,
                 }
             }
         except asyncio.TimeoutError:
             raise TimeoutError(f"Tool call '{tool_name}' timed out after {self.timeout}s")
 
-    async def list_tools(self) -> list[dict[str, Any]]:
+    async def call_tools_batch(self, calls: list[tuple[str, dict[str, Any]]]) -> list[dict[str, Any]]:
+        """Call several independent tools concurrently on the MCP server.
+
+        The requests share one session; responses are matched by JSON-RPC request id.
+
+        Args:
+            calls: List of (tool_name, arguments) tuples
+
+        Returns:
+            Tool results as dicts, in the order of calls
+        """
+        return list(await asyncio.gather(*(self.call_tool(name, arguments) for name, arguments in calls)))
+
+    async def list_tools(self, force_refresh: bool = False) -> list[dict[str, Any]]:
         """List all available tools on the server.
 
+        The tool manifest does not change during a session, so the first response
+        is cached and reused until the client is stopped.
+
+        Args:
+            force_refresh: Fetch the tool list from the server even if it is cached
+
         Returns:
             List of tool definitions as dicts
         """
         if not self.session:
             raise RuntimeError("Not connected to MCP server. Call start() first.")
 
-        try:
-            result = await asyncio.wait_for(
-                self.session.list_tools(),
-                timeout=self.timeout,
-            )
-
-            # Convert Tool objects to dicts
-            return [
+        if self._tools_cache is None or force_refresh:
+            try:
+                result = await asyncio.wait_for(
+                    self.session.list_tools(),
+                    timeout=self.timeout,
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"List tools timed out after {self.timeout}s")
+
+            # Tool is a pydantic model, so its fields can be read directly
+            self._tools_cache = [
                 {
                     "name": tool.name,
                     "description": tool.description,
-                    "inputSchema": tool.inputSchema if hasattr(tool, "inputSchema") else {},
+                    "inputSchema": tool.inputSchema,
                 }
                 for tool in result.tools
             ]
-        except asyncio.TimeoutError:
-            raise TimeoutError(f"List tools timed out after {self.timeout}s")
 
-    async def list_resources(self) -> list[dict[str, Any]]:
+        return list(self._tools_cache)
+
+    async def list_resources(self, force_refresh: bool = False) -> list[dict[str, Any]]:
         """List all available resources on the server.
 
+        Like the tool list, the resource list is cached until the client is stopped.
+
+        Args:
+            force_refresh: Fetch the resource list from the server even if it is cached
+
         Returns:
             List of resource definitions as dicts
         """
         if not self.session:
             raise RuntimeError("Not connected to MCP server. Call start() first.")
 
-        try:
-            result = await asyncio.wait_for(
-                self.session.list_resources(),
-                timeout=self.timeout,
-            )
+        if self._resources_cache is None or force_refresh:
+            try:
+                result = await asyncio.wait_for(
+                    self.session.list_resources(),
+                    timeout=self.timeout,
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"List resources timed out after {self.timeout}s")
 
             # Convert Resource objects to dicts
-            return [
+            self._resources_cache = [
                 {
                     "uri": resource.uri,
                     "name": resource.name,
-                    "description": resource.description if hasattr(resource, "description") else "",
+                    "description": resource.description,
                 }
                 for resource in result.resources
             ]
-        except asyncio.TimeoutError:
-            raise TimeoutError(f"List resources timed out after {self.timeout}s")
+
+        return list(self._resources_cache)
 
     async def read_resource(self, uri: str) -> dict[str, Any]:
         """Read content of a resource from the server.
@@ -196,6 +196,18 @@ class TestResamplingMinMax:
 
         assert len(result) <= 10
 
+    def test_minmax_with_independent_index(self):
+        """Test min-max keeps extremes when the independent column is the index."""
+        values = [1.0] * 100
+        values[50] = 500.0
+        values[70] = -500.0
+        df = pd.DataFrame({"value": values}, index=pd.Index([i * 0.1 for i in range(100)], name="time"))
+        result = _resample_dataframe_minmax(df, 10)
+
+        assert len(result) <= 10
+        assert result["value"].max() == 500.0
+        assert result["value"].min() == -500.0
+
 
 class TestResamplingAuto:
     """Test automatic resampling method selection."""
@@ -226,6 +238,14 @@ class TestResamplingAuto:
 
         assert len(result) == 10
 
+    def test_auto_ignores_non_numeric_and_all_nan_columns(self):
+        """Test auto variance check skips string and all-NaN columns."""
+        df = pd.DataFrame({"name": ["x"] * 100, "empty": [float("nan")] * 100, "value": range(100, 200)})
+        result = _resample_dataframe(df, 10, method="auto")
+
+        # Low variance in the only usable column selects uniform sampling
+        pd.testing.assert_frame_equal(result, _resample_dataframe_uniform(df, 10))
+
     def test_auto_no_resampling_when_not_needed(self):
         """Test auto doesn't resample when data is smaller than target."""
         df = pd.DataFrame({"value": range(10)})
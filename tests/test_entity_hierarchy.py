@@ -1,5 +1,6 @@
 """Tests for entity hierarchy functions."""
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
@@ -15,11 +16,7 @@ class TestGetTestToMeasurementHierarchy:
         """Reset singleton instance before each test."""
         from odsbox_jaquel_mcp.connection import ODSConnectionManager
 
-        ODSConnectionManager._instance = None
-        ODSConnectionManager._con_i = None
-        ODSConnectionManager._model_cache = None
-        ODSConnectionManager._model = None
-        ODSConnectionManager._connection_info = None
+        ODSConnectionManager._reset_for_tests()
 
     def test_hierarchy_no_connection(self):
         """Test hierarchy retrieval without connection."""
@@ -32,15 +29,8 @@ class TestGetTestToMeasurementHierarchy:
         from odsbox_jaquel_mcp.connection import ODSConnectionManager
 
         # Create mock entities
-        mock_ao_test = Mock()
-        mock_ao_test.name = "Test"
-        mock_ao_test.base_name = "AoTest"
-        mock_ao_test.relations = {}
-
-        mock_ao_measurement = Mock()
-        mock_ao_measurement.name = "Measurement"
-        mock_ao_measurement.base_name = "AoMeasurement"
-        mock_ao_measurement.relations = {}
+        mock_ao_test = SimpleNamespace(name="Test", base_name="AoTest", relations={})
+        mock_ao_measurement = SimpleNamespace(name="Measurement", base_name="AoMeasurement", relations={})
 
         # Setup ConI mock
         mock_coni = Mock()
@@ -81,31 +71,22 @@ class TestGetTestToMeasurementHierarchy:
         """Test hierarchy with AoTest -> AoSubTest -> AoMeasurement chain."""
         from odsbox_jaquel_mcp.connection import ODSConnectionManager
 
-        # Create mock entities
-        mock_ao_test = Mock()
-        mock_ao_test.name = "Test"
-        mock_ao_test.base_name = "AoTest"
-
-        mock_ao_subtest = Mock()
-        mock_ao_subtest.name = "SubTest"
-        mock_ao_subtest.base_name = "AoSubTest"
-
-        mock_ao_measurement = Mock()
-        mock_ao_measurement.name = "Measurement"
-        mock_ao_measurement.base_name = "AoMeasurement"
-
         # Setup relations
-        mock_children_relation_1 = Mock()
-        mock_children_relation_1.entity_name = "SubTest"
-        mock_children_relation_1.inverse_name = "parent_test"
-
-        mock_children_relation_2 = Mock()
-        mock_children_relation_2.entity_name = "Measurement"
-        mock_children_relation_2.inverse_name = "parent_test"
+        mock_children_relation_1 = SimpleNamespace(
+            name="children", base_name="children", entity_name="SubTest", inverse_name="parent_test"
+        )
+        mock_children_relation_2 = SimpleNamespace(
+            name="children", base_name="children", entity_name="Measurement", inverse_name="parent_test"
+        )
 
-        mock_ao_test.relations = {}
-        mock_ao_subtest.relations = {}
-        mock_ao_measurement.relations = {}
+        # Create mock entities carrying their 'children' relations
+        mock_ao_test = SimpleNamespace(
+            name="Test", base_name="AoTest", relations={"children": mock_children_relation_1}
+        )
+        mock_ao_subtest = SimpleNamespace(
+            name="SubTest", base_name="AoSubTest", relations={"children": mock_children_relation_2}
+        )
+        mock_ao_measurement = SimpleNamespace(name="Measurement", base_name="AoMeasurement", relations={})
 
         # Setup ConI mock
         mock_coni = Mock()
@@ -123,11 +104,7 @@ class TestGetTestToMeasurementHierarchy:
                 return mock_ao_measurement
 
         def relation_no_throw(entity, rel_name):
-            if entity == mock_ao_test and rel_name == "children":
-                return mock_children_relation_1
-            elif entity == mock_ao_subtest and rel_name == "children":
-                return mock_children_relation_2
-            return None
+            return entity.relations.get(rel_name)
 
         def entity(entity_name):
             if entity_name == "SubTest":
@@ -190,6 +167,10 @@ class TestGetTestToMeasurementHierarchy:
         with pytest.raises(ToolError, match="Hierarchy traversal failed"):
             SchemaInspector.schema_test_to_measurement_hierarchy()
 
+        # Traversal must stop at the first failure instead of retrying other lookups
+        mock_model_cache.entity_by_base_name.assert_called_once_with("AoTest")
+        mock_model_cache.relation_no_throw.assert_not_called()
+
     def test_hierarchy_with_descriptions(self):
         """Test that entity descriptions are included in hierarchy."""
         # Verify descriptions exist for key entities
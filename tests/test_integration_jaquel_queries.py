@@ -8,9 +8,11 @@ Mark all tests with @pytest.mark.integration to allow filtering.
 
 import pytest
 from fastmcp.exceptions import ToolError
+from hypothesis import HealthCheck, example, given, settings
 
 from odsbox_jaquel_mcp import ODSConnectionManager
 from odsbox_jaquel_mcp.queries import JaquelExplain
+from tests.jaquel_strategies import unit_by_dimension_queries
 
 
 @pytest.mark.integration
@@ -18,18 +20,14 @@ class TestJaquelQueryIntegration:
     """Integration tests for Jaquel query execution against live ODS server."""
 
     @pytest.fixture(autouse=True)
-    def setup_teardown(self, integration_credentials):
+    def setup_teardown(self, integration_credentials, ods_auth):
         """Connect before each test and disconnect after."""
-        ODSConnectionManager._instance = None
-        ODSConnectionManager._con_i = None
-        ODSConnectionManager._model_cache = None
-        ODSConnectionManager._model = None
-        ODSConnectionManager._connection_info = None
+        ODSConnectionManager._reset_for_tests()
 
         # Connect
         ODSConnectionManager.connect(
             url=integration_credentials["url"],
-            auth=(integration_credentials["username"], integration_credentials["password"]),
+            auth=ods_auth,
         )
 
         yield
@@ -136,14 +134,8 @@ class TestJaquelQueryIntegration:
         with pytest.raises(ToolError):
             ODSConnectionManager.query(query)
 
-    def test_query_explain_functionality(self):
-        """Test the query explain functionality.
-
-        This test verifies:
-        - Query explanations are returned correctly
-        - Explanation content is meaningful
-        """
-        query = {
+    @example(
+        query={
             "AoUnit": {
                 "phys_dimension": {
                     "$or": [
@@ -170,6 +162,17 @@ class TestJaquelQueryIntegration:
             },
             "$attributes": {"name": 1, "factor": 1, "offset": 1, "phys_dimension.name": 1},
         }
+    )
+    @given(query=unit_by_dimension_queries())
+    # The connection set up by the autouse fixture is read-only for query_describe and safe to share across examples
+    @settings(max_examples=10, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    def test_query_explain_functionality(self, query):
+        """Test the query explain functionality.
+
+        This test verifies:
+        - Query explanations are returned correctly
+        - Explanation content is meaningful
+        """
         result = JaquelExplain.query_describe(query)
 
         assert result is not None
@@ -15,6 +15,8 @@ from pathlib import Path
 
 import pytest
 
+EXPECTED_TOOLS: frozenset[str] = frozenset({"ods_connect", "query_execute", "query_validate"})
+
 
 @pytest.mark.integration
 class TestMCPServerIntegration:
@@ -46,7 +48,6 @@ class TestMCPServerIntegration:
             # It means the server started successfully
             pass
 
-    @pytest.mark.asyncio
     async def test_mcp_tool_handler_routing(self):
         """Test that tool names are properly routed to handlers.
 
@@ -64,7 +65,5 @@ class TestMCPServerIntegration:
         assert len(tools) > 20
 
         # Should have connection tools
-        tool_names = [t.name for t in tools]
-        assert "ods_connect" in tool_names
-        assert "query_execute" in tool_names
-        assert "query_validate" in tool_names
+        missing = EXPECTED_TOOLS - {t.name for t in tools}
+        assert not missing, f"Missing tools: {sorted(missing)}"
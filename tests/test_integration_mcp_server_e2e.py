@@ -7,14 +7,38 @@ Run with:
     pytest tests/test_integration_mcp_server_e2e.py -v
 """
 
-import json
+import asyncio
 
 import pytest
 
+EXPECTED_TOOLS: frozenset[str] = frozenset(
+    {
+        # Connection tools
+        "ods_connect",
+        "ods_disconnect",
+        "ods_get_connection_info",
+        # Query validation tools
+        "query_validate",
+        "query_describe",
+        # Schema tools
+        "schema_get_entity",
+        "schema_field_exists",
+        # Data access tools
+        "data_read_submatrix",
+        "query_execute",
+    }
+)
+
+
+def _tool_text(result):
+    """Assert that a call_tool result has content and return the text of its first item."""
+    content = result["result"]["content"]
+    assert len(content) > 0, f"Expected content in result, got: {result}"
+    return content[0]["text"]
+
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_server_lists_tools(mcp_client):
+async def test_server_lists_tools(mcp_tools):
     """Test that server lists all available tools via MCP protocol.
 
     This test verifies:
@@ -22,7 +46,7 @@ async def test_server_lists_tools(mcp_client):
     - Tools have required metadata (name, description)
     - All expected tool categories are present
     """
-    tools = await mcp_client.list_tools()
+    tools = mcp_tools
 
     assert isinstance(tools, list)
     assert len(tools) > 20, "Server should list all tools"
@@ -34,8 +58,7 @@ async def test_server_lists_tools(mcp_client):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_server_has_expected_tools(mcp_client):
+async def test_server_has_expected_tools(mcp_tool_names):
     """Test that server has all expected tool categories.
 
     This test verifies:
@@ -44,29 +67,11 @@ async def test_server_has_expected_tools(mcp_client):
     - Schema inspection tools exist
     - Submatrix tools exist
     """
-    tools = await mcp_client.list_tools()
-    tool_names = {tool["name"] for tool in tools}
-
-    # Connection tools
-    assert "ods_connect" in tool_names
-    assert "ods_disconnect" in tool_names
-    assert "ods_get_connection_info" in tool_names
-
-    # Query validation tools
-    assert "query_validate" in tool_names
-    assert "query_describe" in tool_names
-
-    # Schema tools
-    assert "schema_get_entity" in tool_names
-    assert "schema_field_exists" in tool_names
-
-    # Data access tools
-    assert "data_read_submatrix" in tool_names
-    assert "query_execute" in tool_names
+    missing = EXPECTED_TOOLS - mcp_tool_names
+    assert not missing, f"Missing tools: {sorted(missing)}"
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_query_validate_tool_via_mcp(mcp_client):
     """Test query_validate tool through MCP protocol.
 
@@ -80,19 +85,14 @@ async def test_query_validate_tool_via_mcp(mcp_client):
     # Result should be a proper response
     assert result is not None
 
-    # The result contains content with the actual validation output
-    content = result.get("result", {}).get("content", [])
-    assert len(content) > 0, f"Expected content in result, got: {result}"
-
-    # Parse the JSON from the text content
-    text = content[0].get("text", "{}")
-    validation_result = json.loads(text)
+    # The structured output is decoded once by the MCP session, no need to re-parse the text
+    validation_result = result["result"]["structuredContent"]
+    assert validation_result is not None, f"Expected structured content in result, got: {result}"
 
     assert "valid" in validation_result or "errors" in validation_result
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_list_resources(mcp_client):
     """Test that server lists available resources.
 
@@ -114,7 +114,6 @@ async def test_list_resources(mcp_client):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_read_resource_ods_connection_guide(mcp_client):
     """Test reading ODS connection guide resource via MCP.
 
@@ -137,7 +136,6 @@ async def test_read_resource_ods_connection_guide(mcp_client):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_read_resource_jaquel_syntax_guide(mcp_client):
     """Test reading Jaquel syntax guide resource via MCP.
 
@@ -162,7 +160,6 @@ async def test_read_resource_jaquel_syntax_guide(mcp_client):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_read_all_available_resources(mcp_client):
     """Test reading all available resources via MCP.
 
@@ -195,7 +192,6 @@ async def test_read_all_available_resources(mcp_client):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_read_resource_query_operators_reference(mcp_client):
     """Test reading query operators reference resource via MCP.
 
@@ -219,7 +215,6 @@ async def test_read_resource_query_operators_reference(mcp_client):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_read_resource_invalid_uri_graceful_response(mcp_client):
     """Test that reading invalid resource URI returns an error.
 
@@ -235,7 +230,6 @@ async def test_read_resource_invalid_uri_graceful_response(mcp_client):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_query_get_operator_docs_via_mcp(mcp_client):
     """Test query_get_operator_docs tool through MCP protocol.
 
@@ -250,51 +244,52 @@ async def test_query_get_operator_docs_via_mcp(mcp_client):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_server_handles_invalid_tool_gracefully(mcp_client):
     """Test that server handles invalid tool calls gracefully.
 
     This test verifies:
     - Invalid tool names are rejected
     - Error message is meaningful
-    - Server doesn't crash
+    - Server doesn't crash and the shared session keeps accepting calls
     """
-    # This might raise an exception or return an error response
+    # This might raise an exception or return an error response, but it must not hang
     try:
-        result = await mcp_client.call_tool("nonexistent_tool_xyz", {})
+        result = await asyncio.wait_for(mcp_client.call_tool("nonexistent_tool_xyz", {}), timeout=5.0)
 
         # If it returns a result, should have error info
         if isinstance(result, dict):
             assert "error" in result or "result" in result
+    except TimeoutError:
+        pytest.fail("Invalid tool call did not get a response within 5s")
     except Exception as e:
         # Some error is expected for invalid tool
         assert "nonexistent" in str(e).lower() or "unknown" in str(e).lower()
 
+    # The session must survive the failed call
+    result = await mcp_client.call_tool("query_validate", {"query": {"TestEntity": {}}})
+    assert not result["result"]["isError"]
+
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.serial
 async def test_multiple_sequential_calls(mcp_client):
-    """Test multiple sequential tool calls through MCP protocol.
+    """Test multiple tool calls through MCP protocol.
 
     This test verifies:
-    - Server handles multiple requests sequentially
+    - Server handles multiple in-flight requests on one session
     - Connection remains stable
     - Results are independent
     """
-    # Call 1: Validate query
-    result1 = await mcp_client.call_tool("query_validate", {"query": {"Entity1": {}}})
-    assert result1 is not None
-
-    # Call 2: Get operator docs
-    result2 = await mcp_client.call_tool("query_get_operator_docs", {"operator": "$like"})
-    assert result2 is not None
-
-    # Call 3: List patterns
-    result3 = await mcp_client.call_tool("query_list_patterns", {})
-    assert result3 is not None
+    result1, result2, result3 = await mcp_client.call_tools_batch(
+        [
+            ("query_validate", {"query": {"Entity1": {}}}),
+            ("query_get_operator_docs", {"operator": "$like"}),
+            ("query_list_patterns", {}),
+        ]
+    )
 
     # All calls should succeed independently
-    assert result1 != result2 != result3
+    assert not any(r["result"]["isError"] for r in (result1, result2, result3))
 
 
 # ============================================================================
@@ -305,8 +300,7 @@ async def test_multiple_sequential_calls(mcp_client):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_connect_to_ods_via_mcp(mcp_client, integration_credentials):
+async def test_connect_to_ods_via_mcp(mcp_client, ods_connect_arguments):
     """Test connecting to ODS server through MCP protocol.
 
     This test verifies:
@@ -314,24 +308,15 @@ async def test_connect_to_ods_via_mcp(mcp_client, integration_credentials):
     - ODS server responds successfully
     - Connection state is established
     """
-    result = await mcp_client.call_tool(
-        "ods_connect",
-        {
-            "url": integration_credentials["url"],
-            "username": integration_credentials["username"],
-            "password": integration_credentials["password"],
-        },
-    )
+    result = await mcp_client.call_tool("ods_connect", ods_connect_arguments)
 
     assert result is not None
     # Should contain connection result
-    content = result.get("result", {}).get("content", [])
-    assert len(content) > 0, f"Expected content in result, got: {result}"
+    _tool_text(result)
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_list_entities_via_ods_mcp(mcp_client, integration_credentials):
+async def test_list_entities_via_ods_mcp(mcp_client, ods_session):
     """Test listing ODS entities through MCP after connecting.
 
     This test verifies:
@@ -339,26 +324,14 @@ async def test_list_entities_via_ods_mcp(mcp_client, integration_credentials):
     - Can list entities via MCP
     - Returns proper entity information
     """
-    # Connect first
-    await mcp_client.call_tool(
-        "ods_connect",
-        {
-            "url": integration_credentials["url"],
-            "username": integration_credentials["username"],
-            "password": integration_credentials["password"],
-        },
-    )
-
     # Check connection info
     result = await mcp_client.call_tool("ods_get_connection_info", {})
     assert result is not None
-    content = result.get("result", {}).get("content", [])
-    assert len(content) > 0, "Should have connection info"
+    _tool_text(result)
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_query_execute_via_ods_mcp(mcp_client, integration_credentials):
+async def test_query_execute_via_ods_mcp(mcp_client, ods_session):
     """Test executing a Jaquel query through MCP with ODS connection.
 
     This test verifies:
@@ -366,35 +339,20 @@ async def test_query_execute_via_ods_mcp(mcp_client, integration_credentials):
     - Can execute queries via MCP
     - Returns data from ODS
     """
-    # Connect first
-    await mcp_client.call_tool(
-        "ods_connect",
-        {
-            "url": integration_credentials["url"],
-            "username": integration_credentials["username"],
-            "password": integration_credentials["password"],
-        },
-    )
-
     # Execute a simple query
     query = {"AoTest": {"name": "*"}, "$attributes": {"id": 1, "name": 1}, "$options": {"$rowlimit": 5}}
 
     result = await mcp_client.call_tool("query_execute", {"query": query})
     assert result is not None
 
-    # Should have content with results
-    content = result.get("result", {}).get("content", [])
-    assert len(content) > 0, f"Expected query results, got: {result}"
-
-    # Parse the result
-    text = content[0].get("text", "{}")
-    query_result = json.loads(text)
+    # Should have structured query results
+    query_result = result["result"]["structuredContent"]
+    assert query_result is not None, f"Expected query results, got: {result}"
     assert isinstance(query_result, dict)
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_query_validate_with_ods_context(mcp_client, integration_credentials):
+async def test_query_validate_with_ods_context(mcp_client, ods_session):
     """Test query validation with active ODS connection.
 
     This test verifies:
@@ -402,33 +360,20 @@ async def test_query_validate_with_ods_context(mcp_client, integration_credentia
     - Validates against actual schema
     - Returns validation results
     """
-    # Connect first
-    await mcp_client.call_tool(
-        "ods_connect",
-        {
-            "url": integration_credentials["url"],
-            "username": integration_credentials["username"],
-            "password": integration_credentials["password"],
-        },
-    )
-
     # Validate a query
     query = {"AoTest": {"name": "Test*"}, "$attributes": {"id": 1, "name": 1}, "$options": {"$rowlimit": 5}}
 
     result = await mcp_client.call_tool("query_validate", {"query": query})
     assert result is not None
 
-    content = result.get("result", {}).get("content", [])
-    assert len(content) > 0, f"Expected validation result, got: {result}"
-
-    text = content[0].get("text", "{}")
-    validation_result = json.loads(text)
+    validation_result = result["result"]["structuredContent"]
+    assert validation_result is not None, f"Expected validation result, got: {result}"
     assert "valid" in validation_result or "errors" in validation_result
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_ods_connection_persistence(mcp_client, integration_credentials):
+@pytest.mark.serial
+async def test_ods_connection_persistence(mcp_client, ods_session):
     """Test that ODS connection persists across multiple tool calls.
 
     This test verifies:
@@ -436,16 +381,6 @@ async def test_ods_connection_persistence(mcp_client, integration_credentials):
     - Multiple queries can use same connection
     - No need to reconnect between calls
     """
-    # Connect
-    await mcp_client.call_tool(
-        "ods_connect",
-        {
-            "url": integration_credentials["url"],
-            "username": integration_credentials["username"],
-            "password": integration_credentials["password"],
-        },
-    )
-
     # Call 1: Get connection info
     result1 = await mcp_client.call_tool("ods_get_connection_info", {})
     assert result1 is not None
@@ -463,7 +398,7 @@ async def test_ods_connection_persistence(mcp_client, integration_credentials):
     assert result3 is not None
 
     # All should succeed with same connection
-    assert result1 != result2 != result3
+    assert not any(r["result"]["isError"] for r in (result1, result2, result3))
 
     result4 = await mcp_client.call_tool(
         "query_describe",
@@ -499,8 +434,6 @@ async def test_ods_connection_persistence(mcp_client, integration_credentials):
     )
     assert result4 is not None
     # Result should contain explanation content
-    content = result4.get("result", {}).get("content", [])
-    assert len(content) > 0, f"Expected content in result, got: {result4}"
-    text = content[0].get("text", "")
+    text = _tool_text(result4)
     assert "Textual Representation:" in text
     assert "SQL-like Representation:" in text
@@ -17,18 +17,14 @@ class TestODSIntegration:
 
     def setup_method(self):
         """Reset singleton before each test."""
-        ODSConnectionManager._instance = None
-        ODSConnectionManager._con_i = None
-        ODSConnectionManager._model_cache = None
-        ODSConnectionManager._model = None
-        ODSConnectionManager._connection_info = None
+        ODSConnectionManager._reset_for_tests()
 
     def teardown_method(self):
         """Clean up connection after each test."""
         if ODSConnectionManager.is_connected():
             ODSConnectionManager.disconnect()
 
-    def test_connect_to_ods_server(self, integration_credentials):
+    def test_connect_to_ods_server(self, integration_credentials, ods_auth):
         """Test connecting to live ODS server.
 
         This test verifies:
@@ -38,7 +34,7 @@ class TestODSIntegration:
         """
         result = ODSConnectionManager.connect(
             url=integration_credentials["url"],
-            auth=(integration_credentials["username"], integration_credentials["password"]),
+            auth=ods_auth,
         )
 
         assert ODSConnectionManager.is_connected()
@@ -46,24 +42,67 @@ class TestODSIntegration:
         assert result.connection.url.startswith(integration_credentials["url"])
         assert result.connection.username == integration_credentials["username"]
 
-    def test_list_entities(self, integration_credentials):
-        """Test retrieving available entities from ODS server.
+    def test_disconnect_from_ods_server(self, integration_credentials, ods_auth):
+        """Test disconnecting from ODS server.
 
         This test verifies:
-        - Entity list can be retrieved after connection
-        - Common ODS entities are present (Measurement, Unit, Test, etc.)
-        - Entity count is reasonable
+        - Connection can be closed properly
+        - Connection state is updated
+        - Cleanup is performed
         """
         ODSConnectionManager.connect(
             url=integration_credentials["url"],
-            auth=(integration_credentials["username"], integration_credentials["password"]),
+            auth=ods_auth,
+        )
+
+        assert ODSConnectionManager.is_connected()
+
+        ODSConnectionManager.disconnect()
+
+        assert not ODSConnectionManager.is_connected()
+
+
+@pytest.mark.integration
+class TestODSSharedConnection:
+    """Integration tests that only read from a live ODS connection shared by the whole class."""
+
+    @pytest.fixture(scope="class", autouse=True)
+    def ods_connection(self, integration_credentials, ods_auth):
+        """Connect once for all tests of the class and disconnect afterwards."""
+        ODSConnectionManager._reset_for_tests()
+
+        ODSConnectionManager.connect(
+            url=integration_credentials["url"],
+            auth=ods_auth,
         )
 
-        model = ODSConnectionManager.get_model()
-        assert model is not None
-        assert hasattr(model, "entities")
+        yield
+
+        if ODSConnectionManager.is_connected():
+            ODSConnectionManager.disconnect()
+
+    @pytest.fixture(scope="class")
+    def ods_model(self, ods_connection):
+        """ODS model loaded by the shared connection."""
+        return ODSConnectionManager.get_model()
+
+    @pytest.fixture(scope="class")
+    def ods_model_cache(self, ods_connection):
+        """Model cache built by the shared connection."""
+        return ODSConnectionManager.get_model_cache()
+
+    def test_list_entities(self, ods_model):
+        """Test retrieving available entities from ODS server.
 
-        entities = model.entities
+        This test verifies:
+        - Entity list can be retrieved after connection
+        - Common ODS entities are present (Measurement, Unit, Test, etc.)
+        - Entity count is reasonable
+        """
+        assert ods_model is not None
+        assert hasattr(ods_model, "entities")
+
+        entities = ods_model.entities
         entity_names = list(entities.keys()) if hasattr(entities, "keys") else [e.name for e in entities]
 
         # Check for common ODS entities
@@ -73,22 +112,16 @@ class TestODSIntegration:
         assert len(entity_names) > 0, "No entities found in ODS server"
         assert len(available_common) > 0, f"No common ODS entities found. Available: {entity_names[:10]}"
 
-    def test_get_model_cache(self, integration_credentials):
+    def test_get_model_cache(self, ods_model_cache):
         """Test that model cache is properly initialized.
 
         This test verifies:
         - Model cache is created after connection
         - Model cache contains expected content
         """
-        ODSConnectionManager.connect(
-            url=integration_credentials["url"],
-            auth=(integration_credentials["username"], integration_credentials["password"]),
-        )
+        assert ods_model_cache is not None
 
-        model_cache = ODSConnectionManager.get_model_cache()
-        assert model_cache is not None
-
-    def test_query_measurements(self, integration_credentials):
+    def test_query_measurements(self):
         """Test executing a query for measurements.
 
         This test verifies:
@@ -96,50 +129,23 @@ class TestODSIntegration:
         - Query results are returned properly
         - Result contains expected structure
         """
-        ODSConnectionManager.connect(
-            url=integration_credentials["url"],
-            auth=(integration_credentials["username"], integration_credentials["password"]),
-        )
-
         # Simple query to get first few measurements
         query = {"AoMeasurement": {}}
 
         result = ODSConnectionManager.query(query)
 
-        assert "result" in result
-
-    def test_disconnect_from_ods_server(self, integration_credentials):
-        """Test disconnecting from ODS server.
-
-        This test verifies:
-        - Connection can be closed properly
-        - Connection state is updated
-        - Cleanup is performed
-        """
-        ODSConnectionManager.connect(
-            url=integration_credentials["url"],
-            auth=(integration_credentials["username"], integration_credentials["password"]),
+        expected_keys = {"result", "total_rows", "returned_rows", "truncated"}
+        assert expected_keys <= result.keys() and result["returned_rows"] <= result["total_rows"], (
+            f"Malformed query result: {result}"
         )
 
-        assert ODSConnectionManager.is_connected()
-
-        ODSConnectionManager.disconnect()
-
-        assert not ODSConnectionManager.is_connected()
-
-    def test_connection_reuse(self, integration_credentials):
+    def test_connection_reuse(self, ods_model):
         """Test that singleton connection can be reused across operations.
 
         This test verifies:
         - Connection is reused across multiple operations
         - Singleton pattern works correctly
         """
-        # First connection
-        ODSConnectionManager.connect(
-            url=integration_credentials["url"],
-            auth=(integration_credentials["username"], integration_credentials["password"]),
-        )
-
         instance1 = ODSConnectionManager.get_instance()
 
         # Second get_instance should return same object
@@ -149,6 +155,5 @@ class TestODSIntegration:
         # Connection should still be active
         assert ODSConnectionManager.is_connected()
 
-        # Model should be accessible
-        model = ODSConnectionManager.get_model()
-        assert model is not None
+        # The model loaded on connect is still the one the manager hands out
+        assert ODSConnectionManager.get_model() is ods_model
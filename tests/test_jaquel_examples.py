@@ -4,6 +4,38 @@ import pytest
 
 from odsbox_jaquel_mcp import JaquelExamples
 
+# (operation, expected values by dotted key path); operation None uses the default
+SKELETON_CASES = [
+    pytest.param("get_all", {"TestEntity": {}, "$options.$rowlimit": 5}, id="get_all"),
+    pytest.param("get_by_id", {"TestEntity": 123}, id="get_by_id"),
+    pytest.param(
+        "get_by_name",
+        {"TestEntity": {"name": "SearchName"}, "$attributes": {"*": 1}},
+        id="get_by_name",
+    ),
+    pytest.param(
+        "search_and_select",
+        {
+            "TestEntity": {"name": {"$like": "Search*"}},
+            "$attributes": {"id": 1, "name": 1},
+            "$orderby": {"name": 1},
+            "$options.$rowlimit": 10,
+        },
+        id="search_and_select",
+    ),
+    pytest.param(None, {"TestEntity": {}, "$options.$rowlimit": 5}, id="default_operation"),
+]
+
+
+def assert_skeleton_matches(result, expected):
+    """Assert that each dotted key path of expected resolves to its value in result."""
+    for path, value in expected.items():
+        node = result
+        for key in path.split("."):
+            assert key in node, f"{path!r} missing in {result}"
+            node = node[key]
+        assert node == value, f"{path!r}: expected {value!r}, got {node!r}"
+
 
 class TestJaquelExamples:
     """Test cases for JaquelExamples."""
@@ -22,66 +54,60 @@ class TestJaquelExamples:
         with pytest.raises(ValueError, match="Unknown pattern: unknown_pattern"):
             JaquelExamples.get_pattern("unknown_pattern")
 
+    def test_get_pattern_returns_independent_copy(self):
+        """Test that modifying a returned pattern does not corrupt the next call."""
+        first = JaquelExamples.get_pattern("get_by_id")
+        first["template"] = "modified"
+        first["extra"] = "added"
+
+        second = JaquelExamples.get_pattern("get_by_id")
+        assert second["template"] == '{"EntityName": 123}'
+        assert "extra" not in second
+
+    def test_basic_patterns_entries_are_read_only(self):
+        """Test that the shared pattern table cannot be modified at any level."""
+        with pytest.raises(TypeError):
+            JaquelExamples.BASIC_PATTERNS["get_by_id"]["template"] = "modified"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            JaquelExamples.BASIC_PATTERNS["new_pattern"] = {}  # type: ignore[index]
+
     def test_list_patterns(self):
         """Test listing all patterns."""
         patterns = JaquelExamples.list_patterns()
 
         assert isinstance(patterns, list)
-        assert "get_all_instances" in patterns
-        assert "get_by_id" in patterns
-        assert "get_by_name" in patterns
-        assert "case_insensitive_search" in patterns
-        assert "time_range" in patterns
-        assert "inner_join" in patterns
-        assert "outer_join" in patterns
-        assert "aggregates" in patterns
-
-    def test_query_generate_skeleton_get_all(self):
-        """Test generating get_all skeleton."""
-        result = JaquelExamples.query_generate_skeleton("TestEntity", "get_all")
-
-        assert "TestEntity" in result
-        assert result["TestEntity"] == {}
-        assert "$options" in result
-        assert result["$options"]["$rowlimit"] == 5
-
-    def test_query_generate_skeleton_get_by_id(self):
-        """Test generating get_by_id skeleton."""
-        result = JaquelExamples.query_generate_skeleton("TestEntity", "get_by_id")
-
-        assert "TestEntity" in result
-        assert result["TestEntity"] == 123
-
-    def test_query_generate_skeleton_get_by_name(self):
-        """Test generating get_by_name skeleton."""
-        result = JaquelExamples.query_generate_skeleton("TestEntity", "get_by_name")
-
-        assert "TestEntity" in result
-        assert result["TestEntity"] == {"name": "SearchName"}
-        assert "$attributes" in result
-        assert result["$attributes"] == {"*": 1}
-
-    def test_query_generate_skeleton_search_and_select(self):
-        """Test generating search_and_select skeleton."""
-        result = JaquelExamples.query_generate_skeleton("TestEntity", "search_and_select")
-
-        assert "TestEntity" in result
-        assert result["TestEntity"] == {"name": {"$like": "Search*"}}
-        assert "$attributes" in result
-        assert "$orderby" in result
-        assert "$options" in result
-        assert result["$options"]["$rowlimit"] == 10
+        expected = {
+            "get_all_instances",
+            "get_by_id",
+            "get_by_name",
+            "case_insensitive_search",
+            "time_range",
+            "inner_join",
+            "outer_join",
+            "aggregates",
+        }
+        missing = expected - set(patterns)
+        assert not missing, f"Missing patterns: {sorted(missing)}"
+
+    @pytest.mark.parametrize("operation,expected", SKELETON_CASES)
+    def test_query_generate_skeleton(self, operation, expected):
+        """Test the skeleton generated for each operation."""
+        if operation is None:
+            result = JaquelExamples.query_generate_skeleton("TestEntity")
+        else:
+            result = JaquelExamples.query_generate_skeleton("TestEntity", operation)
+
+        assert_skeleton_matches(result, expected)
 
     def test_query_generate_skeleton_unknown_operation(self):
         """Test generating skeleton with unknown operation."""
         with pytest.raises(ValueError, match="Unknown operation: unknown_op"):
             JaquelExamples.query_generate_skeleton("TestEntity", "unknown_op")
 
-    def test_query_generate_skeleton_default_operation(self):
-        """Test generating skeleton with default operation."""
-        result = JaquelExamples.query_generate_skeleton("TestEntity")
+    def test_query_generate_skeleton_returns_fresh_dict(self):
+        """Test that each skeleton call returns a new, independently mutable dict."""
+        first = JaquelExamples.query_generate_skeleton("AoTest", "get_all")
+        first["$options"]["$rowlimit"] = 1000
 
-        assert "TestEntity" in result
-        assert result["TestEntity"] == {}
-        assert "$options" in result
-        assert result["$options"]["$rowlimit"] == 5
+        second = JaquelExamples.query_generate_skeleton("AoTest", "get_all")
+        assert second["$options"]["$rowlimit"] == 5
@@ -1,41 +1,60 @@
 """Tests for JaquelValidator."""
 
 import pytest
+from hypothesis import given
 
 from odsbox_jaquel_mcp import JaquelValidator
+from tests.jaquel_strategies import unit_by_dimension_queries
+
+VALID_QUERIES = [
+    pytest.param({"TestEntity": {}}, id="simple"),
+    pytest.param({"AoTest": {"name": {"$eq": "test"}}}, id="condition_eq"),
+    pytest.param({"AoTest": {"name": "test"}}, id="condition_implicit_eq"),
+    pytest.param({"AoTest": {"state": 123}}, id="condition_int_value"),
+]
+
+# (query, expected substring of the first error)
+INVALID_QUERIES = [
+    pytest.param("not a dict", "Query must be a dictionary", id="invalid_type"),
+    pytest.param({"$attributes": {"name": 1}}, "Query must contain an entity name", id="no_entity"),
+    pytest.param({"TestEntity": None}, "query value cannot be None", id="entity_none_value"),
+    pytest.param({"TestEntity": []}, "query value must be dict, int, or string", id="entity_invalid_value_type"),
+    pytest.param(
+        {"TestEntity": {}, "$attributes": "invalid"}, "$attributes must be a dictionary", id="attributes_type"
+    ),
+    pytest.param({"TestEntity": {}, "$orderby": "invalid"}, "$orderby must be a dictionary", id="orderby_type"),
+    pytest.param({"TestEntity": {}, "$groupby": "invalid"}, "$groupby must be a dictionary", id="groupby_type"),
+    pytest.param(
+        {"TestEntity": {}, "$options": {"$rowlimit": "invalid"}}, "$rowlimit must be an integer", id="rowlimit"
+    ),
+    pytest.param({"TestEntity": {}, "$options": {"$rowskip": "invalid"}}, "$rowskip must be an integer", id="rowskip"),
+    pytest.param({"AoTest": {"name": {"$unknown": "value"}}}, "Unknown operator: $unknown", id="unknown_operator"),
+    pytest.param({"AoTest": {"field": {"$between": "not a list"}}}, "$between requires a list value", id="between"),
+    pytest.param({"AoTest": {"$and": "not a list"}}, "$and must contain an array at 'AoTest'", id="and_type"),
+    pytest.param({"AoTest": {"$not": "not a dict"}}, "$not must contain expression at 'AoTest'", id="not_type"),
+]
+
+# (query, result key, expected substring of the first message) for queries that stay valid
+ADVISORY_QUERIES = [
+    pytest.param(
+        {"TestEntity": {}, "$unknown": "value"}, "warnings", "Unknown special key: $unknown", id="special_key"
+    ),
+    pytest.param(
+        {"TestEntity": {}, "$attributes": {}},
+        "suggestions",
+        "consider removing it or adding attributes",
+        id="empty_attributes",
+    ),
+    pytest.param({"AoTest": {"field": {"$null": 0}}}, "warnings", "$null should have value 1", id="null_value"),
+]
 
 
 class TestJaquelValidator:
     """Test cases for JaquelValidator."""
 
-    def test_query_validate_invalid_type(self):
-        """Test validation of non-dict query."""
-        result = JaquelValidator.query_validate("not a dict")
-
-        assert result["valid"] is False
-        assert "Query must be a dictionary" in result["errors"]
-
-    def test_query_validate_no_entity(self):
-        """Test validation of query with no entity name."""
-        query = {"$attributes": {"name": 1}}
-        result = JaquelValidator.query_validate(query)
-
-        assert result["valid"] is False
-        assert "Query must contain an entity name" in result["errors"][0]
-
-    def test_query_validate_multiple_entities(self):
-        """Test validation of query with multiple non-$ entities."""
-        query = {"Entity1": {}, "Entity2": {}}
-        result = JaquelValidator.query_validate(query)
-
-        assert result["valid"] is False
-        assert "Query is only allowed to contain a single non-$ element" in result["errors"][0]
-        assert "Entity1" in result["errors"][0]
-        assert "Entity2" in result["errors"][0]
-
-    def test_query_validate_valid_simple(self):
-        """Test validation of simple valid query."""
-        query = {"TestEntity": {}}
+    @pytest.mark.parametrize("query", VALID_QUERIES)
+    def test_query_validate_valid(self, query):
+        """Test validation of valid queries and filter conditions."""
         result = JaquelValidator.query_validate(query)
 
         assert result["valid"] is True
@@ -43,144 +62,39 @@ class TestJaquelValidator:
         assert result["warnings"] == []
         assert result["suggestions"] == []
 
-    def test_query_validate_entity_none_value(self):
-        """Test validation when entity value is None."""
-        query = {"TestEntity": None}
+    @pytest.mark.parametrize("query,expected", INVALID_QUERIES)
+    def test_query_validate_invalid(self, query, expected):
+        """Test validation of invalid queries and filter conditions."""
         result = JaquelValidator.query_validate(query)
 
         assert result["valid"] is False
-        assert "query value cannot be None" in result["errors"][0]
+        assert expected in result["errors"][0]
 
-    def test_query_validate_entity_invalid_value_type(self):
-        """Test validation when entity value has invalid type."""
-        query = {"TestEntity": []}
-        result = JaquelValidator.query_validate(query)
-
-        assert result["valid"] is False
-        assert "query value must be dict, int, or string" in result["errors"][0]
-
-    def test_query_validate_unknown_special_key(self):
-        """Test validation with unknown special key."""
-        query = {"TestEntity": {}, "$unknown": "value"}
+    @pytest.mark.parametrize("query,kind,expected", ADVISORY_QUERIES)
+    def test_query_validate_advisory(self, query, kind, expected):
+        """Test validation of valid queries that produce warnings or suggestions."""
         result = JaquelValidator.query_validate(query)
 
         assert result["valid"] is True
-        assert "Unknown special key: $unknown" in result["warnings"]
-
-    def test_query_validate_empty_attributes(self):
-        """Test validation with empty $attributes."""
-        query = {"TestEntity": {}, "$attributes": {}}
-        result = JaquelValidator.query_validate(query)
-
-        assert result["valid"] is True
-        assert "consider removing it or adding attributes" in result["suggestions"][0]
-
-    def test_query_validate_invalid_attributes_type(self):
-        """Test validation with invalid $attributes type."""
-        query = {"TestEntity": {}, "$attributes": "invalid"}
-        result = JaquelValidator.query_validate(query)
-
-        assert result["valid"] is False
-        assert "$attributes must be a dictionary" in result["errors"]
-
-    def test_query_validate_invalid_orderby_type(self):
-        """Test validation with invalid $orderby type."""
-        query = {"TestEntity": {}, "$orderby": "invalid"}
-        result = JaquelValidator.query_validate(query)
-
-        assert result["valid"] is False
-        assert "$orderby must be a dictionary" in result["errors"][0]
-
-    def test_query_validate_invalid_groupby_type(self):
-        """Test validation with invalid $groupby type."""
-        query = {"TestEntity": {}, "$groupby": "invalid"}
-        result = JaquelValidator.query_validate(query)
-
-        assert result["valid"] is False
-        assert "$groupby must be a dictionary" in result["errors"]
+        assert expected in result[kind][0]
 
-    def test_query_validate_invalid_rowlimit_type(self):
-        """Test validation with invalid $rowlimit type."""
-        query = {"TestEntity": {}, "$options": {"$rowlimit": "invalid"}}
+    def test_query_validate_multiple_entities(self):
+        """Test validation of query with multiple non-$ entities."""
+        query = {"Entity1": {}, "Entity2": {}}
         result = JaquelValidator.query_validate(query)
 
         assert result["valid"] is False
-        assert "$rowlimit must be an integer" in result["errors"]
+        assert "Query is only allowed to contain a single non-$ element" in result["errors"][0]
+        assert "Entity1" in result["errors"][0]
+        assert "Entity2" in result["errors"][0]
 
-    def test_query_validate_invalid_rowskip_type(self):
-        """Test validation with invalid $rowskip type."""
-        query = {"TestEntity": {}, "$options": {"$rowskip": "invalid"}}
+    @given(query=unit_by_dimension_queries())
+    def test_query_validate_unit_by_dimension_queries(self, query):
+        """Test validation of generated AoUnit queries with '$or' over dimension exponents."""
         result = JaquelValidator.query_validate(query)
 
-        assert result["valid"] is False
-        assert "$rowskip must be an integer" in result["errors"]
-
-    def test_schema_validate_condition_valid_simple(self):
-        """Test validation of simple valid filter condition."""
-        condition = {"name": {"$eq": "test"}}
-        result = JaquelValidator.query_validate({"AoTest": condition})
-
         assert result["valid"] is True
         assert result["errors"] == []
-        assert result["warnings"] == []
-
-    def test_schema_validate_condition_valid_simple2(self):
-        """Test validation of simple valid filter condition."""
-        condition = {"name": "test"}
-        result = JaquelValidator.query_validate({"AoTest": condition})
-
-        assert result["valid"] is True
-        assert result["errors"] == []
-        assert result["warnings"] == []
-
-    def test_schema_validate_condition_valid_simple3(self):
-        """Test validation of simple valid filter condition."""
-        condition = {"state": 123}
-        result = JaquelValidator.query_validate({"AoTest": condition})
-
-        assert result["valid"] is True
-        assert result["errors"] == []
-        assert result["warnings"] == []
-
-    def test_schema_validate_condition_unknown_operator(self):
-        """Test validation with unknown operator."""
-        condition = {"name": {"$unknown": "value"}}
-        result = JaquelValidator.query_validate({"AoTest": condition})
-
-        assert result["valid"] is False
-        assert "Unknown operator: $unknown" in result["errors"][0]
-
-    def test_schema_validate_condition_invalid_null_value(self):
-        """Test validation of $null with invalid value."""
-        condition = {"field": {"$null": 0}}
-        result = JaquelValidator.query_validate({"AoTest": condition})
-
-        assert result["valid"] is True
-        assert "$null should have value 1" in result["warnings"][0]
-
-    def test_schema_validate_condition_invalid_between_type(self):
-        """Test validation of $between with non-list value."""
-        condition = {"field": {"$between": "not a list"}}
-        result = JaquelValidator.query_validate({"AoTest": condition})
-
-        assert result["valid"] is False
-        assert "$between requires a list value" in result["errors"][0]
-
-    def test_schema_validate_condition_invalid_and_type(self):
-        """Test validation of $and with non-list value."""
-        condition = {"$and": "not a list"}
-        result = JaquelValidator.query_validate({"AoTest": condition})
-
-        assert result["valid"] is False
-        assert "$and must contain an array at 'AoTest'" in result["errors"]
-
-    def test_schema_validate_condition_invalid_not_type(self):
-        """Test validation of $not with non-dict value."""
-        condition = {"$not": "not a dict"}
-        result = JaquelValidator.query_validate({"AoTest": condition})
-
-        assert result["valid"] is False
-        assert "$not must contain expression at 'AoTest'" in result["errors"]
 
     def test_get_operator_info_known_operator(self):
         """Test getting info for known operator."""
@@ -196,6 +110,13 @@ class TestJaquelValidator:
         with pytest.raises(ValueError, match="Unknown operator: \\$unknown"):
             JaquelValidator.get_operator_info("$unknown")
 
+    def test_get_operator_info_returns_independent_copy(self):
+        """Test that modifying returned operator info does not affect later calls."""
+        first = JaquelValidator.get_operator_info("$eq")
+        first["description"] = "modified"
+
+        assert JaquelValidator.get_operator_info("$eq")["description"] == "Equal comparison"
+
     def test_get_operator_info_like_with_options(self):
         """Test getting info for $like operator with options."""
         result = JaquelValidator.get_operator_info("$like")
@@ -1,10 +1,15 @@
 """Tests for MCP server functions."""
 
-from unittest.mock import patch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
 
 import pytest
 
-from odsbox_jaquel_mcp.schemas_types import ConnectionInfo, ConnectResult
+from odsbox_jaquel_mcp import JaquelExamples, ODSConnectionManager, SchemaInspector, SubmatrixDataReader
+from odsbox_jaquel_mcp import server as server_module
+from odsbox_jaquel_mcp.queries import JaquelExplain
+from odsbox_jaquel_mcp.schemas_types import ConnectionInfo, ConnectResult, EntitySchema
 from odsbox_jaquel_mcp.server import (
     data_generate_fetcher_script,
     data_get_quantities,
@@ -26,6 +31,113 @@ from odsbox_jaquel_mcp.server import (
     schema_list_entities,
 )
 
+# Shared, read-only test inputs and mock results
+_TEST_QUERY: dict[str, Any] = {"TestEntity": {}}
+_TEST_URL = "http://test:8087/api"
+_CONNECTION_INFO = ConnectionInfo(
+    url=_TEST_URL,
+    username="user",
+    con_i_url="",
+    status="connected",
+    available_entities=[],
+    initial_query={},
+)
+_CONNECT_RESULT = ConnectResult(message="Connected to ODS server", connection=_CONNECTION_INFO)
+# Minimal stand-in for an ODS model: entities keyed by name
+_ENTITY = SimpleNamespace(name="TestEntity", base_name="TestBase", relations={})
+_MODEL = SimpleNamespace(entities={"TestEntity": _ENTITY})
+
+# Canned SubmatrixDataReader results
+_MEASUREMENT_QUANTITIES = [
+    {
+        "id": 1,
+        "name": "Time",
+        "measurement_quantity": {"name": "Time", "unit": "s", "datatype": 2},
+    }
+]
+_SUBMATRIX_PREVIEW = {
+    "submatrix_id": 456,
+    "columns": ["Time", "Temperature"],
+    "row_count": 1000,
+    "preview_row_count": 100,
+    "data_preview": [[1, 25.5], [2, 26.0], [3, 25.8]],
+    "sampling_method": "auto",
+    "note": "Preview resampled from 1000 to 100 rows using 'auto' method",
+}
+
+# (tool, arguments, expected result keys, expected result values) for tools that work offline
+OFFLINE_TOOL_CASES = [
+    pytest.param(
+        query_validate,
+        {"query": _TEST_QUERY},
+        {"valid", "errors", "warnings", "suggestions"},
+        {},
+        id="query_validate",
+    ),
+    pytest.param(
+        query_get_operator_docs,
+        {"operator": "$eq"},
+        {"category"},
+        {"category": "comparison"},
+        id="query_get_operator_docs",
+    ),
+    pytest.param(
+        query_get_pattern,
+        {"pattern": "get_all_instances"},
+        {"template", "description"},
+        {},
+        id="query_get_pattern",
+    ),
+    pytest.param(
+        query_list_patterns,
+        {},
+        {"available_patterns", "description"},
+        {"available_patterns": JaquelExamples.list_patterns()},
+        id="query_list_patterns",
+    ),
+    pytest.param(
+        query_generate_skeleton,
+        {"entity_name": "TestEntity", "operation": "get_all"},
+        {"TestEntity"},
+        {},
+        id="query_generate_skeleton",
+    ),
+]
+
+# (tool kwargs, env prefix set, env prefix cleared, VERIFY value, expected verify_certificate)
+CONNECT_USING_ENV_CASES = [
+    pytest.param({}, "ODSBOX_MCP", None, "false", False, id="default_prefix"),
+    pytest.param({"env_prefix": "ODS"}, "ODS", None, "false", False, id="override_prefix"),
+    # Legacy ODS_ variables are used when the ODSBOX_MCP_ ones are absent
+    pytest.param({}, "ODS", "ODSBOX_MCP", "true", True, id="fallback_to_ods_vars"),
+]
+
+
+def _assert_keys(data, required):
+    """Assert that the dict data contains all required keys, reporting every missing one."""
+    missing = required - data.keys()
+    assert not missing, f"Missing keys: {sorted(missing)}"
+
+
+@pytest.fixture
+def connection_manager(monkeypatch):
+    """Replace ODSConnectionManager in the server module with a spec'd mock.
+
+    One monkeypatch covers every manager method the connection tools call, instead of
+    patching each method separately.
+    """
+    manager = Mock(spec=ODSConnectionManager)
+    monkeypatch.setattr(server_module, "ODSConnectionManager", manager)
+    return manager
+
+
+@pytest.fixture
+def submatrix_reader(monkeypatch):
+    """Replace SubmatrixDataReader in the server module with a spec'd mock."""
+    reader = Mock(spec=SubmatrixDataReader)
+    monkeypatch.setattr(server_module, "SubmatrixDataReader", reader)
+    return reader
+
 
 class TestMCPServer:
     """Test cases for MCP server functions."""
@@ -35,68 +147,33 @@ class TestMCPServer:
         # Verify the mcp instance exists and is properly configured
         assert mcp.name == "odsbox-jaquel-mcp"
 
-    def test_call_tool_query_validate(self):
-        """Test calling query_validate tool."""
-        query = {"TestEntity": {}}
-
-        result = query_validate(query=query)
-
-        assert isinstance(result, dict)
-        assert "valid" in result
-        assert "errors" in result
-        assert "warnings" in result
-        assert "suggestions" in result
-
-    def test_call_tool_query_get_operator_docs(self):
-        """Test calling query_get_operator_docs tool."""
-        result = query_get_operator_docs(operator="$eq")
-
-        assert isinstance(result, dict)
-        assert "category" in result
-        assert result["category"] == "comparison"
-
-    def test_call_tool_query_get_pattern(self):
-        """Test calling query_get_pattern tool."""
-        result = query_get_pattern(pattern="get_all_instances")
-
-        assert isinstance(result, dict)
-        assert "template" in result
-        assert "description" in result
-
-    def test_call_tool_query_list_patterns(self):
-        """Test calling query_list_patterns tool."""
-        result = query_list_patterns()
-
-        assert isinstance(result, dict)
-        assert "available_patterns" in result
-        assert "description" in result
-        assert isinstance(result["available_patterns"], list)
+    @pytest.mark.parametrize("tool,arguments,expected_keys,expected_values", OFFLINE_TOOL_CASES)
+    def test_call_tool_offline(self, tool, arguments, expected_keys, expected_values):
+        """Test calling tools that need no ODS connection and return a dict."""
+        result = tool(**arguments)
 
-    def test_call_tool_query_generate_skeleton(self):
-        """Test calling query_generate_skeleton tool."""
-        result = query_generate_skeleton(entity_name="TestEntity", operation="get_all")
+        assert type(result) is dict
+        _assert_keys(result, expected_keys)
+        for key, value in expected_values.items():
+            assert result[key] == value
 
-        assert isinstance(result, dict)
-        assert "TestEntity" in result
-
-    @patch("odsbox_jaquel_mcp.server.JaquelExplain.query_describe")
-    def test_call_tool_query_describe(self, mock_describe):
+    def test_call_tool_query_describe(self, monkeypatch):
         """Test calling query_describe tool."""
-        mock_describe.return_value = "Query describes TestEntity"
-        query = {"TestEntity": {}}
+        mock_describe = Mock(return_value="Query describes TestEntity")
+        monkeypatch.setattr(JaquelExplain, "query_describe", mock_describe)
+        query = _TEST_QUERY
 
         result = query_describe(query=query)
 
         # Should return plain text explanation
-        assert isinstance(result, str)
+        assert type(result) is str
         assert len(result) > 0
         mock_describe.assert_called_once_with(query)
 
-    @patch("odsbox_jaquel_mcp.server.SchemaInspector.get_entity_schema")
-    def test_call_tool_schema_get_entity(self, mock_get_schema):
+    def test_call_tool_schema_get_entity(self, monkeypatch):
         """Test calling schema_get_entity tool."""
-        from odsbox_jaquel_mcp.schemas_types import EntitySchema
-
+        mock_get_schema = Mock()
+        monkeypatch.setattr(SchemaInspector, "get_entity_schema", mock_get_schema)
         mock_get_schema.return_value = EntitySchema(
             entity="TestEntity",
             derived_from="AoTest",
@@ -107,172 +184,68 @@ class TestMCPServer:
 
         result = schema_get_entity(entity_name="TestEntity")
 
-        assert isinstance(result, EntitySchema)
+        assert type(result) is EntitySchema
         assert result.entity == "TestEntity"
         mock_get_schema.assert_called_once_with("TestEntity")
 
-    @patch("odsbox_jaquel_mcp.server.SchemaInspector.schema_field_exists")
-    def test_call_tool_schema_field_exists(self, mock_validate):
+    def test_call_tool_schema_field_exists(self, monkeypatch):
         """Test calling schema_field_exists tool."""
-        mock_validate.return_value = {"exists": True}
+        mock_validate = Mock(return_value={"exists": True})
+        monkeypatch.setattr(SchemaInspector, "schema_field_exists", mock_validate)
 
         result = schema_field_exists(entity_name="TestEntity", field_name="name")
 
-        assert isinstance(result, dict)
+        assert type(result) is dict
         mock_validate.assert_called_once_with("TestEntity", "name")
 
-    @patch("odsbox_jaquel_mcp.server.ODSConnectionManager.connect")
-    @pytest.mark.asyncio
-    async def test_call_tool_ods_connect(self, mock_connect):
-        """Test calling ods_connect tool."""
-        mock_connect.return_value = ConnectResult(
-            message="Connected to ODS server",
-            connection=ConnectionInfo(
-                url="http://test:8087/api",
-                username="user",
-                con_i_url="",
-                status="connected",
-                available_entities=[],
-                initial_query={},
-            ),
-        )
-
-        result = await ods_connect(url="http://test:8087/api", username="user", password="pass")
-
-        assert isinstance(result, ConnectResult)
-        mock_connect.assert_called_once_with(
-            url="http://test:8087/api", auth=("user", "pass"), verify_certificate=True
-        )
-
-    @patch("odsbox_jaquel_mcp.server.ODSConnectionManager.connect")
-    @pytest.mark.asyncio
-    async def test_call_tool_ods_connect_verify_false(self, mock_connect):
+    @pytest.mark.parametrize(
+        "verify_kwargs,expected_verify",
+        [
+            pytest.param({}, True, id="verify_default"),
+            pytest.param({"verify": False}, False, id="verify_false"),
+        ],
+    )
+    async def test_call_tool_ods_connect(self, connection_manager, verify_kwargs, expected_verify):
         """Test calling ods_connect tool."""
-        mock_connect.return_value = ConnectResult(
-            message="Connected to ODS server",
-            connection=ConnectionInfo(
-                url="http://test:8087/api",
-                username="user",
-                con_i_url="",
-                status="connected",
-                available_entities=[],
-                initial_query={},
-            ),
-        )
-
-        result = await ods_connect(url="http://test:8087/api", username="user", password="pass", verify=False)
+        connection_manager.connect.return_value = _CONNECT_RESULT
 
-        assert isinstance(result, ConnectResult)
-        mock_connect.assert_called_once_with(
-            url="http://test:8087/api", auth=("user", "pass"), verify_certificate=False
-        )
-
-    @patch("odsbox_jaquel_mcp.server.ODSConnectionManager.connect_with_factory")
-    @pytest.mark.asyncio
-    async def test_call_tool_ods_connect_using_env_default_prefix(self, mock_connect, monkeypatch):
-        """Test calling ods_connect_using_env tool with default prefix (ODSBOX_MCP)."""
-        mock_connect.return_value = ConnectResult(
-            message="Connected to ODS server",
-            connection=ConnectionInfo(
-                url="http://test:8087/api",
-                username="user",
-                con_i_url="",
-                status="connected",
-                available_entities=[],
-                initial_query={},
-            ),
-        )
-
-        monkeypatch.setenv("ODSBOX_MCP_URL", "http://test:8087/api")
-        monkeypatch.setenv("ODSBOX_MCP_USERNAME", "user")
-        monkeypatch.setenv("ODSBOX_MCP_PASSWORD", "pass")
-        monkeypatch.setenv("ODSBOX_MCP_VERIFY", "false")
-
-        result = await ods_connect_using_env()
+        result = await ods_connect(url=_TEST_URL, username="user", password="pass", **verify_kwargs)
 
-        assert isinstance(result, ConnectResult)
-        mock_connect.assert_called_once()
-        auth_args = mock_connect.call_args[0][0]
-        assert auth_args["mode"] == "basic"
-        assert auth_args["url"] == "http://test:8087/api"
-        assert auth_args["username"] == "user"
-        assert auth_args["password"] == "pass"
-        assert auth_args["verify_certificate"] is False
-
-    @patch("odsbox_jaquel_mcp.server.ODSConnectionManager.connect_with_factory")
-    @pytest.mark.asyncio
-    async def test_call_tool_ods_connect_using_env_override_prefix(self, mock_connect, monkeypatch):
-        """Test calling ods_connect_using_env tool with an explicit env_prefix."""
-        mock_connect.return_value = ConnectResult(
-            message="Connected to ODS server",
-            connection=ConnectionInfo(
-                url="http://test:8087/api",
-                username="user",
-                con_i_url="",
-                status="connected",
-                available_entities=[],
-                initial_query={},
-            ),
+        assert type(result) is ConnectResult
+        connection_manager.connect.assert_called_once_with(
+            url=_TEST_URL, auth=("user", "pass"), verify_certificate=expected_verify
         )
 
-        monkeypatch.setenv("ODS_URL", "http://test:8087/api")
-        monkeypatch.setenv("ODS_USERNAME", "user")
-        monkeypatch.setenv("ODS_PASSWORD", "pass")
-        monkeypatch.setenv("ODS_VERIFY", "false")
-
-        result = await ods_connect_using_env(env_prefix="ODS")
-
-        assert isinstance(result, ConnectResult)
-        mock_connect.assert_called_once()
-        auth_args = mock_connect.call_args[0][0]
-        assert auth_args["mode"] == "basic"
-        assert auth_args["url"] == "http://test:8087/api"
-        assert auth_args["username"] == "user"
-        assert auth_args["password"] == "pass"
-        assert auth_args["verify_certificate"] is False
-
-    @patch("odsbox_jaquel_mcp.server.ODSConnectionManager.connect_with_factory")
-    @pytest.mark.asyncio
-    async def test_call_tool_ods_connect_using_env_fallback_to_ods_vars(self, mock_connect, monkeypatch):
-        """Test that ods_connect_using_env falls back to legacy ODS_ env vars when ODSBOX_MCP_ vars are absent."""
-        mock_connect.return_value = ConnectResult(
-            message="Connected to ODS server",
-            connection=ConnectionInfo(
-                url="http://test:8087/api",
-                username="user",
-                con_i_url="",
-                status="connected",
-                available_entities=[],
-                initial_query={},
-            ),
-        )
+    @pytest.mark.parametrize("tool_kwargs,set_prefix,cleared_prefix,verify,expected_verify", CONNECT_USING_ENV_CASES)
+    async def test_call_tool_ods_connect_using_env(
+        self, connection_manager, monkeypatch, tool_kwargs, set_prefix, cleared_prefix, verify, expected_verify
+    ):
+        """Test calling ods_connect_using_env tool with basic auth taken from the environment."""
+        connection_manager.connect_with_factory.return_value = _CONNECT_RESULT
 
-        monkeypatch.delenv("ODSBOX_MCP_URL", raising=False)
-        monkeypatch.delenv("ODSBOX_MCP_USERNAME", raising=False)
-        monkeypatch.delenv("ODSBOX_MCP_PASSWORD", raising=False)
-        monkeypatch.delenv("ODSBOX_MCP_VERIFY", raising=False)
+        if cleared_prefix:
+            for suffix in ("URL", "USERNAME", "PASSWORD", "VERIFY"):
+                monkeypatch.delenv(f"{cleared_prefix}_{suffix}", raising=False)
 
-        monkeypatch.setenv("ODS_URL", "http://test:8087/api")
-        monkeypatch.setenv("ODS_USERNAME", "user")
-        monkeypatch.setenv("ODS_PASSWORD", "pass")
-        monkeypatch.setenv("ODS_VERIFY", "true")
+        monkeypatch.setenv(f"{set_prefix}_URL", _TEST_URL)
+        monkeypatch.setenv(f"{set_prefix}_USERNAME", "user")
+        monkeypatch.setenv(f"{set_prefix}_PASSWORD", "pass")
+        monkeypatch.setenv(f"{set_prefix}_VERIFY", verify)
 
-        result = await ods_connect_using_env()
+        result = await ods_connect_using_env(**tool_kwargs)
 
-        assert isinstance(result, ConnectResult)
-        mock_connect.assert_called_once()
-        auth_args = mock_connect.call_args[0][0]
+        assert type(result) is ConnectResult
+        connection_manager.connect_with_factory.assert_called_once()
+        auth_args = connection_manager.connect_with_factory.call_args[0][0]
         assert auth_args["mode"] == "basic"
-        assert auth_args["url"] == "http://test:8087/api"
+        assert auth_args["url"] == _TEST_URL
         assert auth_args["username"] == "user"
         assert auth_args["password"] == "pass"
-        assert auth_args["verify_certificate"] is True
+        assert auth_args["verify_certificate"] is expected_verify
 
-    @patch("odsbox_jaquel_mcp.server.ODSConnectionManager.connect_with_factory")
-    @pytest.mark.asyncio
-    async def test_call_tool_ods_connect_using_env_missing_required_env_vars(self, mock_connect, monkeypatch):
+    async def test_call_tool_ods_connect_using_env_missing_required_env_vars(self, connection_manager, monkeypatch):
         """Test that missing required env vars raises an error."""
-        mock_connect.return_value = {"message": "Connected to ODS server", "connection": {}}
+        connection_manager.connect_with_factory.return_value = {"message": "Connected to ODS server", "connection": {}}
 
         monkeypatch.delenv("ODSBOX_MCP_URL", raising=False)
         monkeypatch.delenv("ODSBOX_MCP_USERNAME", raising=False)
@@ -281,115 +254,81 @@ class TestMCPServer:
         with pytest.raises(ValueError, match="must be set"):
             await ods_connect_using_env()
 
-    @patch("odsbox_jaquel_mcp.server.ODSConnectionManager.disconnect")
-    def test_call_tool_ods_disconnect(self, mock_disconnect):
+    def test_call_tool_ods_disconnect(self, connection_manager):
         """Test calling ods_disconnect tool."""
-        mock_disconnect.return_value = {"message": "Disconnected from ODS server"}
+        connection_manager.disconnect.return_value = {"message": "Disconnected from ODS server"}
 
         result = ods_disconnect()
 
-        assert isinstance(result, dict)
-        mock_disconnect.assert_called_once()
+        assert type(result) is dict
+        connection_manager.disconnect.assert_called_once()
 
-    @patch("odsbox_jaquel_mcp.server.ODSConnectionManager.get_connection_info")
-    def test_call_tool_ods_get_connection_info(self, mock_get_info):
+    def test_call_tool_ods_get_connection_info(self, connection_manager):
         """Test calling ods_get_connection_info tool."""
-        mock_get_info.return_value = ConnectionInfo(
-            url="http://test:8087/api",
-            username="user",
-            con_i_url="",
-            status="connected",
-            available_entities=[],
-            initial_query={},
-        )
+        connection_manager.get_connection_info.return_value = _CONNECTION_INFO
 
         result = ods_get_connection_info()
 
-        assert isinstance(result, ConnectionInfo)
-        mock_get_info.assert_called_once()
+        assert type(result) is ConnectionInfo
+        connection_manager.get_connection_info.assert_called_once()
 
-    @patch("odsbox_jaquel_mcp.server.ODSConnectionManager.get_model")
-    def test_call_tool_schema_list_entities(self, mock_get_model):
+    def test_call_tool_schema_list_entities(self, monkeypatch):
         """Test calling schema_list_entities tool."""
-        from unittest.mock import MagicMock
-
-        # Mock the model and entities
-        mock_model = MagicMock()
-        mock_entity = MagicMock()
-        mock_entity.name = "TestEntity"
-        mock_entity.base_name = "TestBase"
-        mock_entity.relations = {}
-        # Mock entities as a dictionary (entity_name -> entity)
-        mock_model.entities = {"TestEntity": mock_entity}
-        mock_get_model.return_value = mock_model
+        monkeypatch.setattr(ODSConnectionManager, "get_model", Mock(return_value=_MODEL))
 
         result = schema_list_entities()
 
-        assert isinstance(result, dict)
-        assert "entities" in result
-        assert "count" in result
+        assert type(result) is dict
+        _assert_keys(result, {"entities", "count"})
         assert len(result["entities"]) == 1
         assert result["entities"][0]["name"] == "TestEntity"
         assert result["entities"][0]["basename"] == "TestBase"
 
-    @patch("odsbox_jaquel_mcp.server.ODSConnectionManager.query")
-    @pytest.mark.asyncio
-    async def test_call_tool_query_execute(self, mock_query):
+    async def test_call_tool_query_execute(self, connection_manager):
         """Test calling query_execute tool."""
-        mock_query.return_value = {"result": "data"}
+        connection_manager.query.return_value = {"result": "data"}
 
-        result = await query_execute(query={"TestEntity": {}})
+        result = await query_execute(query=_TEST_QUERY)
 
-        assert isinstance(result, dict)
+        assert type(result) is dict
         assert result["result"] == "data"
 
-    @patch("odsbox_jaquel_mcp.server.SubmatrixDataReader.get_measurement_quantities")
-    def test_call_tool_data_get_quantities(self, mock_get_quantities):
+    def test_call_tool_data_get_quantities(self, submatrix_reader):
         """Test calling data_get_quantities tool."""
-        mock_get_quantities.return_value = [
-            {
-                "id": 1,
-                "name": "Time",
-                "measurement_quantity": {"name": "Time", "unit": "s", "datatype": 2},
-            }
-        ]
+        submatrix_reader.get_measurement_quantities.return_value = _MEASUREMENT_QUANTITIES
 
         result = data_get_quantities(submatrix_id=123)
 
-        assert isinstance(result, dict)
+        assert type(result) is dict
         assert result["submatrix_id"] == 123
         assert "measurement_quantities" in result
+        submatrix_reader.get_measurement_quantities.assert_called_once_with(123)
 
-    @patch("odsbox_jaquel_mcp.server.SubmatrixDataReader.data_read_submatrix")
-    @pytest.mark.asyncio
-    async def test_call_tool_data_read_submatrix(self, mock_read_data):
+    async def test_call_tool_data_read_submatrix(self, submatrix_reader):
         """Test calling data_read_submatrix tool."""
-        mock_read_data.return_value = {
-            "submatrix_id": 456,
-            "columns": ["Time", "Temperature"],
-            "row_count": 1000,
-            "preview_row_count": 100,
-            "data_preview": [[1, 25.5], [2, 26.0], [3, 25.8]],
-            "sampling_method": "auto",
-            "note": "Preview resampled from 1000 to 100 rows using 'auto' method",
-        }
+        submatrix_reader.data_read_submatrix.return_value = _SUBMATRIX_PREVIEW
 
         result = await data_read_submatrix(
             submatrix_id=456,
             measurement_quantity_patterns=["Temp*"],
         )
 
-        assert isinstance(result, dict)
-        assert "columns" in result
-        assert "row_count" in result
+        assert type(result) is dict
+        _assert_keys(result, {"columns", "row_count"})
+
+    @pytest.mark.parametrize("max_preview_size", [0, -1])
+    async def test_call_tool_data_read_submatrix_invalid_preview_size(self, submatrix_reader, max_preview_size):
+        """Test that data_read_submatrix rejects non-positive preview sizes before reading."""
+        with pytest.raises(ValueError, match="max_preview_size must be a positive integer"):
+            await data_read_submatrix(submatrix_id=456, max_preview_size=max_preview_size)
+
+        submatrix_reader.data_read_submatrix.assert_not_called()
 
-    @patch("odsbox_jaquel_mcp.server.SubmatrixDataReader.get_measurement_quantities")
-    @patch("odsbox_jaquel_mcp.server.generate_basic_fetcher_script")
-    @pytest.mark.asyncio
-    async def test_call_tool_data_generate_fetcher_script(self, mock_generate_script, mock_get_mqs):
+    async def test_call_tool_data_generate_fetcher_script(self, submatrix_reader, monkeypatch):
         """Test calling data_generate_fetcher_script tool."""
-        mock_get_mqs.return_value = [{"name": "Temperature"}]
-        mock_generate_script.return_value = "# Generated script\nprint('Hello')"
+        submatrix_reader.get_measurement_quantities.return_value = [{"name": "Temperature"}]
+        mock_generate_script = Mock(return_value="# Generated script\nprint('Hello')")
+        monkeypatch.setattr(server_module, "generate_basic_fetcher_script", mock_generate_script)
 
         result = await data_generate_fetcher_script(
             submatrix_id=789,
@@ -397,4 +336,4 @@ class TestMCPServer:
             output_format="csv",
         )
 
-        assert isinstance(result, dict)
+        assert type(result) is dict
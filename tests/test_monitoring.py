@@ -104,7 +104,6 @@ class TestToolStatsMiddlewareInit:
 class TestToolStatsMiddlewareToolCalls:
     """on_call_tool tracking."""
 
-    @pytest.mark.asyncio
     async def test_records_successful_tool_call(self, tmp_path):
         db = tmp_path / "stats.db"
         mw = ToolStatsMiddleware(stats_file=db, enabled=True)
@@ -122,7 +121,6 @@ class TestToolStatsMiddlewareToolCalls:
         assert stats["query_validate"]["total_ms"] > 0
         assert stats["query_validate"]["last_called"] is not None
 
-    @pytest.mark.asyncio
     async def test_records_failed_tool_call(self, tmp_path):
         db = tmp_path / "stats.db"
         mw = ToolStatsMiddleware(stats_file=db, enabled=True)
@@ -136,7 +134,6 @@ class TestToolStatsMiddlewareToolCalls:
         assert stats["ods_connect"]["calls"] == 1
         assert stats["ods_connect"]["errors"] == 1
 
-    @pytest.mark.asyncio
     async def test_increments_on_repeated_calls(self, tmp_path):
         db = tmp_path / "stats.db"
         mw = ToolStatsMiddleware(stats_file=db, enabled=True)
@@ -150,7 +147,6 @@ class TestToolStatsMiddlewareToolCalls:
         assert stats["schema_get_entity"]["calls"] == 5
         assert stats["schema_get_entity"]["errors"] == 0
 
-    @pytest.mark.asyncio
     async def test_tracks_multiple_tools(self, tmp_path):
         db = tmp_path / "stats.db"
         mw = ToolStatsMiddleware(stats_file=db, enabled=True)
@@ -164,7 +160,6 @@ class TestToolStatsMiddlewareToolCalls:
         assert stats["tool_a"]["calls"] == 2
         assert stats["tool_b"]["calls"] == 1
 
-    @pytest.mark.asyncio
     async def test_disabled_middleware_is_noop(self, tmp_path):
         db = tmp_path / "stats.db"
         mw = ToolStatsMiddleware(stats_file=db, enabled=False)
@@ -181,7 +176,6 @@ class TestToolStatsMiddlewareToolCalls:
 class TestToolStatsMiddlewareResourceReads:
     """on_read_resource tracking."""
 
-    @pytest.mark.asyncio
     async def test_records_successful_resource_read(self, tmp_path):
         db = tmp_path / "stats.db"
         mw = ToolStatsMiddleware(stats_file=db, enabled=True)
@@ -199,7 +193,6 @@ class TestToolStatsMiddlewareResourceReads:
         assert stats["guide://jaquel-syntax"]["reads"] == 1
         assert stats["guide://jaquel-syntax"]["errors"] == 0
 
-    @pytest.mark.asyncio
     async def test_records_failed_resource_read(self, tmp_path):
         db = tmp_path / "stats.db"
         mw = ToolStatsMiddleware(stats_file=db, enabled=True)
@@ -216,7 +209,6 @@ class TestToolStatsMiddlewareResourceReads:
         assert stats["guide://missing"]["reads"] == 1
         assert stats["guide://missing"]["errors"] == 1
 
-    @pytest.mark.asyncio
     async def test_disabled_middleware_skips_resource_read(self, tmp_path):
         db = tmp_path / "stats.db"
         mw = ToolStatsMiddleware(stats_file=db, enabled=False)
@@ -235,7 +227,6 @@ class TestToolStatsMiddlewareResourceReads:
 class TestToolStatsMiddlewarePersistence:
     """Cross-session persistence via SQLite."""
 
-    @pytest.mark.asyncio
     async def test_stats_survive_new_middleware_instance(self, tmp_path):
         db = tmp_path / "stats.db"
 
@@ -253,7 +244,6 @@ class TestToolStatsMiddlewarePersistence:
         stats = _read_tool_stats(db)
         assert stats["query_validate"]["calls"] == 3
 
-    @pytest.mark.asyncio
     async def test_mixed_tool_and_resource_persistence(self, tmp_path):
         db = tmp_path / "stats.db"
         mw = ToolStatsMiddleware(stats_file=db, enabled=True)
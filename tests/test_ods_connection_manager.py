@@ -16,11 +16,7 @@ class TestODSConnectionManager:
 
     def setup_method(self):
         """Reset singleton instance before each test."""
-        ODSConnectionManager._instance = None
-        ODSConnectionManager._con_i = None
-        ODSConnectionManager._model_cache = None
-        ODSConnectionManager._model = None
-        ODSConnectionManager._connection_info = None
+        ODSConnectionManager._reset_for_tests()
 
     def test_get_instance_creates_singleton(self):
         """Test that get_instance creates a singleton."""
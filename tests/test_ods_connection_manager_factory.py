@@ -13,11 +13,7 @@ class TestConnectWithFactory:
 
     def setup_method(self):
         """Reset singleton instance before each test."""
-        ODSConnectionManager._instance = None
-        ODSConnectionManager._con_i = None
-        ODSConnectionManager._model_cache = None
-        ODSConnectionManager._model = None
-        ODSConnectionManager._connection_info = None
+        ODSConnectionManager._reset_for_tests()
 
     def _mock_con_i(self):
         """Create a standard mock ConI instance."""